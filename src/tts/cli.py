@@ -1,23 +1,56 @@
 """Main CLI application with subcommands."""
 
-import cyclopts
+import sys
+from functools import cache
 
 from tts import __version__
-from tts.commands import configure, generate, update, voice
 
-app = cyclopts.App(
-    name="tts",
-    help="Text-to-speech CLI for Fish Audio.",
-    version=__version__,
-)
+VERSION_FLAGS = ("--version", "-v")
 
-# Register subcommands
-app.command(generate.generate)
-app.command(configure.app, name="configure")
-app.command(update.update)
-app.command(voice.app, name="voice")
+
+@cache
+def _get_app():
+    """Build the cyclopts app on first use."""
+    import cyclopts
+
+    app = cyclopts.App(
+        name="tts",
+        help="Text-to-speech CLI for Fish Audio.",
+        version=__version__,
+    )
+
+    # Register subcommands lazily so only the invoked command's module is imported
+    app.command(
+        "tts.commands.generate:generate",
+        name="generate",
+        help="Generate speech audio from text files using Fish Audio TTS.",
+    )
+    app.command(
+        "tts.commands.configure:app",
+        name="configure",
+        help="Configure TTS CLI settings.",
+    )
+    app.command(
+        "tts.commands.update:update",
+        name="update",
+        help="Check for updates and auto-update if running as binary. Config is preserved.",
+    )
+    app.command("tts.commands.voice:app", name="voice", help="Manage voice models.")
+    return app
+
+
+def __getattr__(name: str):
+    """Expose `app` as a lazily built module attribute."""
+    if name == "app":
+        return _get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Entry point for the CLI."""
-    app()
+    # Answer `tts --version` without importing cyclopts or any command module
+    if len(sys.argv) == 2 and sys.argv[1] in VERSION_FLAGS:
+        print(__version__)
+        return
+
+    _get_app()()
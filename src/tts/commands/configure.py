@@ -1,6 +1,7 @@
 """Configure command for TTS CLI settings."""
 
 import getpass
+import os
 import sys
 from pathlib import Path
 from typing import Annotated, Literal
@@ -11,6 +12,7 @@ from tts.common import (
     CONFIG_DIR,
     CREDENTIALS_FILE,
     _keyring_available,
+    _read_credentials_key,
     delete_api_key_from_keyring,
     get_api_key_from_keyring,
     set_api_key_in_keyring,
@@ -32,8 +34,6 @@ def _mask_key(key: str) -> str:
 
 def _get_current_api_key() -> tuple[str | None, str]:
     """Get current API key and its source. Returns (key, source)."""
-    import os
-
     # Check environment
     if key := os.environ.get("FISH_API_KEY"):
         return key, "environment variable"
@@ -43,20 +43,34 @@ def _get_current_api_key() -> tuple[str | None, str]:
         return key, "keyring"
 
     # Check credentials file
-    if CREDENTIALS_FILE.is_file():
-        try:
-            content = CREDENTIALS_FILE.read_text(encoding="utf-8")
-            for line in content.splitlines():
-                if line.startswith("FISH_API_KEY="):
-                    key = line.partition("=")[2].strip().strip("\"'")
-                    if key:
-                        return key, f"credentials file ({CREDENTIALS_FILE})"
-        except OSError:
-            pass
+    if key := _read_credentials_key():
+        return key, f"credentials file ({CREDENTIALS_FILE})"
 
     return None, "not configured"
 
 
+def _write_credentials(api_key: str) -> None:
+    """Write the API key to the credentials file, readable only by the owner.
+
+    The key is written to a temporary file that is renamed into place, so a
+    crash never leaves a truncated credentials file.
+    """
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = CREDENTIALS_FILE.with_name(CREDENTIALS_FILE.name + ".tmp")
+    # Created as 0600, so the key is never briefly readable by others
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if hasattr(os, "fchmod"):
+                # O_CREAT's mode doesn't apply to a leftover temp file
+                os.fchmod(fd, 0o600)
+            f.write(f"FISH_API_KEY={api_key}\n".encode())
+        os.replace(tmp_path, CREDENTIALS_FILE)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 @app.default
 def configure_interactive(
     *,
@@ -128,9 +142,7 @@ def _prompt_and_save_api_key() -> None:
         print("API key saved to system keyring (secure storage).")
     else:
         # Fallback to credentials file
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        CREDENTIALS_FILE.write_text(f"FISH_API_KEY={api_key}\n", encoding="utf-8")
-        CREDENTIALS_FILE.chmod(0o600)
+        _write_credentials(api_key)
         print(f"API key saved to {CREDENTIALS_FILE}")
 
 
@@ -174,9 +186,11 @@ def _reset_all() -> None:
     print(f"Reset {CONFIG_FILE}")
 
     # Remove credentials file
-    if CREDENTIALS_FILE.is_file():
+    try:
         CREDENTIALS_FILE.unlink()
         print(f"Removed {CREDENTIALS_FILE}")
+    except FileNotFoundError:
+        pass
 
     # Remove from keyring
     if delete_api_key_from_keyring():
@@ -215,9 +229,7 @@ def configure_api_key(
         print("API key saved to system keyring (secure storage).")
     else:
         # Fallback to credentials file
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        CREDENTIALS_FILE.write_text(f"FISH_API_KEY={key}\n", encoding="utf-8")
-        CREDENTIALS_FILE.chmod(0o600)
+        _write_credentials(key)
         print(f"API key saved to {CREDENTIALS_FILE}")
 
     print("You can now use tts commands without setting FISH_API_KEY.")
@@ -273,6 +285,62 @@ def configure_speed(
     print(f"Default speed set to: {value}")
 
 
+# Labels matching the single-setting commands' confirmations
+_SET_LABELS = {
+    "default_voice": "Default voice",
+    "output_dir": "Default output directory",
+    "format": "Default format",
+    "speed": "Default speed",
+}
+
+
+@app.command(name="set")
+def configure_set(
+    *,
+    voice: Annotated[
+        str | None, cyclopts.Parameter(help="Default voice model ID")
+    ] = None,
+    output_dir: Annotated[
+        str | None, cyclopts.Parameter(help="Default output directory")
+    ] = None,
+    fmt: Annotated[
+        Literal["mp3", "wav", "pcm"] | None,
+        cyclopts.Parameter(name="--format", help="Default audio format"),
+    ] = None,
+    speed: Annotated[
+        float | None, cyclopts.Parameter(help="Default speech speed (0.5-2.0)")
+    ] = None,
+) -> None:
+    """Set several defaults at once, with a single config write."""
+    # Validate everything first so a bad flag leaves the file untouched
+    changes: dict = {}
+    if voice is not None:
+        if not voice.strip():
+            print("Error: Voice ID cannot be empty")
+            sys.exit(1)
+        changes["default_voice"] = voice.strip()
+    if output_dir is not None:
+        if not output_dir.strip():
+            print("Error: Path cannot be empty")
+            sys.exit(1)
+        changes["output_dir"] = output_dir.strip()
+    if fmt is not None:
+        changes["format"] = fmt
+    if speed is not None:
+        if not 0.5 <= speed <= 2.0:
+            print("Error: Speed must be between 0.5 and 2.0")
+            sys.exit(1)
+        changes["speed"] = speed
+
+    if not changes:
+        print("Error: Nothing to set (use --voice, --output-dir, --format or --speed)")
+        sys.exit(1)
+
+    update_config(**changes)
+    for name, value in changes.items():
+        print(f"{_SET_LABELS[name]} set to: {value}")
+
+
 # Legacy support: direct API key argument for backward compatibility
 def configure(api_key: str) -> None:
     """Legacy configure function for backward compatibility."""
@@ -1,6 +1,10 @@
 """Generate speech audio from text files."""
 
+import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Annotated, Literal
 
@@ -9,10 +13,12 @@ from cyclopts import Parameter
 from tts.common import get_fish_client, load_api_key
 from tts.config import load_config
 
+_GLOB_CHARS = frozenset("*?[")
+
 
 def _is_glob_pattern(path_str: str) -> bool:
     """Check if a string contains glob pattern characters."""
-    return any(c in path_str for c in ["*", "?", "["])
+    return not _GLOB_CHARS.isdisjoint(path_str)
 
 
 def find_text_files(path_or_pattern: Path | str) -> list[Path]:
@@ -27,26 +33,75 @@ def find_text_files(path_or_pattern: Path | str) -> list[Path]:
 
     # Handle glob patterns
     if _is_glob_pattern(path_str):
-        matches = sorted(Path.cwd().glob(path_str))
-        # Filter to only .txt files
-        return [f for f in matches if f.is_file() and f.suffix == ".txt"]
+        # A trailing "*" with no extension can carry the suffix itself
+        # ("**/*" -> "**/*.txt"), so the walk never yields non-.txt entries;
+        # patterns that already name an extension are left as written
+        last = path_str.rpartition("/")[2]
+        if last.endswith("*") and last != "**" and "." not in last:
+            path_str += ".txt"
+        matches = Path.cwd().glob(path_str)
+        # Filter to only .txt files, sorting just the survivors
+        return sorted(f for f in matches if f.suffix == ".txt" and f.is_file())
 
     # Handle regular paths
     path = Path(path_str) if isinstance(path_or_pattern, str) else path_or_pattern
 
-    if path.is_file() and path.suffix == ".txt":
+    # One stat answers both the file and the directory question
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        mode = 0
+    if stat.S_ISREG(mode) and path.suffix == ".txt":
         return [path]
-    if path.is_dir():
+    if stat.S_ISDIR(mode):
         try:
-            entries = sorted(path.iterdir())
+            # Name check first; is_file() then uses the cached d_type, so
+            # only symlinks cost a stat
+            with os.scandir(path) as it:
+                names = [e.name for e in it if e.name.endswith(".txt") and e.is_file()]
         except OSError as e:
             print(f"Error reading directory {path}: {e}")
             sys.exit(1)
-        return [f for f in entries if f.suffix == ".txt" and f.is_file()]
+        names.sort()
+        return [path / name for name in names]
     print(f"Error: {path} is not a .txt file or directory")
     sys.exit(1)
 
 
+def _convert_file(
+    client,
+    txt_path: Path,
+    *,
+    output_dir: Path,
+    reference_id: str,
+    format: str,
+    speed: float,
+) -> list[str]:
+    """Convert one text file to audio. Returns the lines to report for it."""
+    try:
+        text = txt_path.read_text(encoding="utf-8").strip()
+    except OSError as e:
+        return [f"  Error reading {txt_path.name}: {e}"]
+
+    if not text:
+        return [f"  Skipping {txt_path.name}: empty file"]
+
+    out_path = output_dir / f"{txt_path.stem}.{format}"
+    lines = [f"  {txt_path.name} -> {out_path.name}"]
+
+    try:
+        audio = client.tts.convert(
+            text=text,
+            reference_id=reference_id,
+            format=format,
+            speed=speed,
+        )
+        out_path.write_bytes(audio)
+    except Exception as e:
+        lines.append(f"  Error generating {txt_path.name}: {e}")
+    return lines
+
+
 def generate(
     input_path: Annotated[
         str, Parameter(help="Path, directory, or glob pattern (e.g., '*.txt', '**/*.txt')")
@@ -67,6 +122,9 @@ def generate(
     env_file: Annotated[
         Path | None, Parameter(name="--env-file", help="Path to .env file")
     ] = None,
+    concurrency: Annotated[
+        int, Parameter(help="Number of files converted in parallel")
+    ] = 4,
 ) -> None:
     """Generate speech audio from text files using Fish Audio TTS.
 
@@ -75,9 +133,6 @@ def generate(
       tts generate "scripts/*.txt"   # All .txt in scripts/
       tts generate "**/*.txt"        # Recursive search
     """
-    load_api_key(env_file)
-    client = get_fish_client()
-
     # Load config defaults
     config = load_config()
 
@@ -96,41 +151,50 @@ def generate(
         print("Error: speed must be between 0.5 and 2.0")
         sys.exit(1)
 
+    if concurrency < 1:
+        print("Error: concurrency must be at least 1")
+        sys.exit(1)
+
     text_files = find_text_files(input_path)
     if not text_files:
         print(f"No .txt files found matching: {input_path}")
         sys.exit(1)
 
+    # Only load the SDK once the arguments are known to be usable
+    load_api_key(env_file)
+    client = get_fish_client()
+
     effective_output_dir.mkdir(parents=True, exist_ok=True)
     print(f"Found {len(text_files)} text file(s)")
     print(f"Reference ID: {effective_reference_id}")
     print(f"Format: {effective_format}, Speed: {effective_speed}")
     print(f"Output: {effective_output_dir}\n")
 
+    convert = partial(
+        _convert_file,
+        client,
+        output_dir=effective_output_dir,
+        reference_id=effective_reference_id,
+        format=effective_format,
+        speed=effective_speed,
+    )
+    # Files sharing a stem (a/intro.txt, b/intro.txt) write the same output,
+    # so each such group runs in order in one task and the last still wins
+    groups: dict[str, list[Path]] = {}
     for txt_path in text_files:
-        try:
-            text = txt_path.read_text(encoding="utf-8").strip()
-        except OSError as e:
-            print(f"  Error reading {txt_path.name}: {e}")
-            continue
-
-        if not text:
-            print(f"  Skipping {txt_path.name}: empty file")
-            continue
-
-        out_path = effective_output_dir / f"{txt_path.stem}.{effective_format}"
-        print(f"  {txt_path.name} -> {out_path.name}")
-
-        try:
-            audio = client.tts.convert(
-                text=text,
-                reference_id=effective_reference_id,
-                format=effective_format,
-                speed=effective_speed,
-            )
-            out_path.write_bytes(audio)
-        except Exception as e:
-            print(f"  Error generating {txt_path.name}: {e}")
-            continue
+        groups.setdefault(txt_path.stem, []).append(txt_path)
+
+    # Requests are network-bound; the report still follows input order
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(groups))) as pool:
+        results = {
+            stem: pool.submit(lambda paths: [convert(p) for p in paths], paths)
+            for stem, paths in groups.items()
+        }
+        reported = dict.fromkeys(groups, 0)
+        for txt_path in text_files:
+            index = reported[txt_path.stem]
+            reported[txt_path.stem] += 1
+            for line in results[txt_path.stem].result()[index]:
+                print(line)
 
     print("\nDone.")
@@ -1,26 +1,49 @@
 """Update check and auto-update command."""
 
-import hashlib
+import contextlib
+import functools
 import platform
-import shutil
-import stat
 import sys
-import tempfile
-import urllib.request
-import json
+import time
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from cyclopts import Parameter
 
+if TYPE_CHECKING:
+    import hashlib
+
+    import httpx
+
 from tts import __version__
+from tts.common import CONFIG_DIR
 
 REPO = "guillempuche/text-to-speech"
 RELEASES_API = f"https://api.github.com/repos/{REPO}/releases/latest"
 
+# Latest-release response cache, revalidated with its validators once stale
+RELEASE_CACHE_FILE = CONFIG_DIR / "update_cache.json"
+RELEASE_CACHE_TTL = 3600
+
+# Retry policy for GitHub API/metadata requests
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Longest Retry-After worth waiting for; beyond it the error is reported
+RETRY_MAX_DELAY = 10
+
+# Read size for streamed downloads; large reads keep the copy loop cheap
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.05
 
+
+@functools.cache
 def get_platform_binary() -> str:
-    """Get the binary name for the current platform."""
+    """Get the binary name for the current platform.
+
+    The platform can't change while running, so it is only detected once.
+    """
     system = platform.system().lower()
     machine = platform.machine().lower()
 
@@ -36,34 +59,141 @@ def get_platform_binary() -> str:
         return f"tts-{system}-{machine}"
 
 
+@functools.cache
+def get_http_client() -> "httpx.Client":
+    """Get the shared HTTP client, so update requests reuse connections."""
+    import httpx
+
+    return httpx.Client(
+        headers={"User-Agent": "tts-cli"},
+        follow_redirects=True,
+        timeout=httpx.Timeout(10, connect=5),
+        # Retries connection failures; status retries are handled in http_get
+        transport=httpx.HTTPTransport(retries=RETRY_ATTEMPTS),
+    )
+
+
+def _retry_after_seconds(value: str) -> float | None:
+    """Parse a Retry-After header (seconds or HTTP-date), or None if invalid."""
+    if value.isdecimal():
+        return int(value)
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def http_get(url: str, **kwargs) -> "httpx.Response":
+    """GET a URL, retrying transient server errors with exponential backoff.
+
+    Honors the server's Retry-After header, but returns the error response
+    instead of waiting longer than RETRY_MAX_DELAY.
+    """
+    client = get_http_client()
+    for attempt in range(RETRY_ATTEMPTS + 1):
+        resp = client.get(url, **kwargs)
+        if resp.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+            return resp
+        delay = RETRY_BACKOFF * 2**attempt
+        retry_after = _retry_after_seconds(resp.headers.get("Retry-After", ""))
+        if retry_after is not None:
+            if retry_after > RETRY_MAX_DELAY:
+                return resp
+            delay = max(delay, retry_after)
+        time.sleep(delay)
+    return resp
+
+
+def _load_release_cache() -> dict | None:
+    """Load the cached release response, discarding it if unreadable."""
+    import json
+
+    try:
+        cached = json.loads(RELEASE_CACHE_FILE.read_bytes())
+        if isinstance(cached.get("release"), dict) and isinstance(
+            cached.get("fetched_at"), (int, float)
+        ):
+            return cached
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, AttributeError):
+        pass
+    # A cache that can't be removed either is still just a miss
+    with contextlib.suppress(OSError):
+        RELEASE_CACHE_FILE.unlink(missing_ok=True)
+    return None
+
+
+def _save_release_cache(release: dict, validators: dict[str, str | None]) -> None:
+    """Atomically write the release response cache (best effort).
+
+    `validators` holds the ETag and Last-Modified values used for
+    conditional requests.
+    """
+    import json
+    import os
+
+    data = {"fetched_at": time.time(), **validators, "release": release}
+    tmp_path = RELEASE_CACHE_FILE.with_suffix(".tmp")
+    try:
+        RELEASE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, RELEASE_CACHE_FILE)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
 def fetch_latest_release() -> dict | None:
-    """Fetch latest release info from GitHub API."""
+    """Fetch latest release info from GitHub API.
+
+    Responses are cached for RELEASE_CACHE_TTL seconds; after that the cache
+    is revalidated with a conditional request.
+    """
+    cached = _load_release_cache()
+    if cached and time.time() - cached["fetched_at"] < RELEASE_CACHE_TTL:
+        return cached["release"]
+
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        req = urllib.request.Request(
-            RELEASES_API,
-            headers={
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "tts-cli",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return json.loads(resp.read().decode())
+        resp = http_get(RELEASES_API, headers=headers)
+        if cached and resp.status_code == 304:
+            # Unchanged upstream: keep the cached body, restart its TTL
+            release = cached["release"]
+            validators = {
+                "etag": resp.headers.get("ETag", cached.get("etag")),
+                "last_modified": resp.headers.get(
+                    "Last-Modified", cached.get("last_modified")
+                ),
+            }
+        else:
+            resp.raise_for_status()
+            release = resp.json()
+            validators = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
     except Exception:
         return None
 
+    _save_release_cache(release, validators)
+    return release
+
 
+@functools.lru_cache(maxsize=256)
 def parse_version(version: str) -> tuple:
     """Parse calver version string to comparable tuple."""
     # Remove 'v' prefix if present
     v = version.lstrip("v")
-    # Split by dots and convert to integers
-    parts = []
-    for part in v.split("."):
-        try:
-            parts.append(int(part))
-        except ValueError:
-            parts.append(0)
-    return tuple(parts)
+    # Split by dots; non-numeric parts count as 0 (no exception path)
+    return tuple(int(part) if part.isdecimal() else 0 for part in v.split("."))
 
 
 def get_binary_path() -> Path | None:
@@ -81,30 +211,70 @@ def get_binary_path() -> Path | None:
     return Path(sys.executable)
 
 
-def download_file(url: str, dest: Path, show_progress: bool = True) -> None:
-    """Download a file from URL to destination with optional progress."""
-    req = urllib.request.Request(url, headers={"User-Agent": "tts-cli"})
+def _prepare_sequential_write(f, size: int) -> None:
+    """Reserve space for a download and hint sequential access (POSIX only)."""
+    import os
 
-    with urllib.request.urlopen(req, timeout=60) as response:
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        if size > 0:
+            os.posix_fallocate(f.fileno(), 0, size)
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        # Not supported by every filesystem; writing still works without it
+        pass
+
+
+def download_file(
+    url: str,
+    dest: Path,
+    show_progress: bool = True,
+    hasher: "hashlib._Hash | None" = None,
+) -> None:
+    """Download a file from URL to destination with optional progress.
+
+    If a hasher is given, it is fed each chunk as it is written, so the
+    checksum is ready without reading the file back.
+    """
+    with get_http_client().stream("GET", url, timeout=60) as response:
+        response.raise_for_status()
         total_size = int(response.headers.get("Content-Length", 0))
+        chunks = response.iter_bytes(DOWNLOAD_CHUNK_SIZE)
         downloaded = 0
-        block_size = 8192
+        last_percent = -1
+        last_draw = 0.0
 
         with open(dest, "wb") as f:
-            while True:
-                buffer = response.read(block_size)
-                if not buffer:
-                    break
+            _prepare_sequential_write(f, total_size)
+            if not (show_progress and total_size > 0):
+                for buffer in chunks:
+                    if hasher:
+                        hasher.update(buffer)
+                    f.write(buffer)
+                # Drop any preallocated tail (Content-Length may be the encoded size)
+                f.truncate()
+                return
+
+            for buffer in chunks:
                 downloaded += len(buffer)
+                if hasher:
+                    hasher.update(buffer)
                 f.write(buffer)
 
-                if show_progress and total_size > 0:
-                    percent = downloaded * 100 // total_size
-                    bar = "=" * (percent // 2) + " " * (50 - percent // 2)
+                percent = downloaded * 100 // total_size
+                now = time.monotonic()
+                # Redraw only on a new percent, at most every PROGRESS_INTERVAL
+                if percent != last_percent and (
+                    percent == 100 or now - last_draw >= PROGRESS_INTERVAL
+                ):
+                    bar = f"{'=' * (percent // 2):<50}"
                     print(f"\r  [{bar}] {percent}%", end="", flush=True)
+                    last_percent = percent
+                    last_draw = now
+            f.truncate()
 
-        if show_progress:
-            print()  # Newline after progress bar
+        print()  # Newline after progress bar
 
 
 def fetch_checksums(tag: str) -> dict[str, str]:
@@ -113,33 +283,37 @@ def fetch_checksums(tag: str) -> dict[str, str]:
     Returns dict mapping filename to sha256 hash.
     """
     url = f"https://github.com/{REPO}/releases/download/{tag}/checksums.txt"
-    req = urllib.request.Request(url, headers={"User-Agent": "tts-cli"})
-
     try:
-        with urllib.request.urlopen(req, timeout=10) as response:
-            content = response.read().decode()
+        response = http_get(url)
+        response.raise_for_status()
+        content = response.text
     except Exception:
         return {}
 
-    checksums = {}
-    for line in content.strip().split("\n"):
-        if line and "  " in line:
-            # Format: "hash  filename"
-            parts = line.split("  ", 1)
-            if len(parts) == 2:
-                checksum, filename = parts
-                checksums[filename.strip()] = checksum.strip()
+    # Format: "hash  filename" per line; lines without the separator are skipped
+    return {
+        filename.strip(): checksum.strip()
+        for checksum, sep, filename in (
+            line.partition("  ") for line in content.splitlines()
+        )
+        if sep
+    }
+
 
-    return checksums
+def digest_matches(digest: bytes, expected: str) -> bool:
+    """Compare a raw digest against an expected hex checksum."""
+    try:
+        return digest == bytes.fromhex(expected)
+    except ValueError:
+        return False
 
 
 def verify_checksum(file_path: Path, expected: str) -> bool:
     """Verify SHA256 checksum of a file."""
-    sha256 = hashlib.sha256()
+    import hashlib
+
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest() == expected
+        return digest_matches(hashlib.file_digest(f, "sha256").digest(), expected)
 
 
 def cleanup_old_binary() -> None:
@@ -164,8 +338,17 @@ def update(
     ] = False,
 ) -> None:
     """Check for updates and auto-update if running as binary. Config is preserved."""
+    # Heavier stdlib modules are only needed once an update actually runs
+    import hashlib
+    import shutil
+    import stat
+    import tempfile
+
+    # Probe the platform once for this run
+    is_windows = platform.system() == "Windows"
+
     # Clean up old binary from previous update (Windows)
-    if platform.system() == "Windows":
+    if is_windows:
         cleanup_old_binary()
 
     print(f"Current version: {__version__}")
@@ -249,17 +432,19 @@ def update(
     ) as tmp:
         tmp_path = Path(tmp.name)
 
+    # Hash while downloading so verification needs no second read
+    hasher = hashlib.sha256() if expected_checksum else None
     try:
-        download_file(download_url, tmp_path)
+        download_file(download_url, tmp_path, hasher=hasher)
     except Exception as e:
         tmp_path.unlink(missing_ok=True)
         print(f"\nDownload failed: {e}")
         sys.exit(1)
 
     # Verify checksum
-    if expected_checksum:
+    if hasher:
         print("Verifying checksum...")
-        if not verify_checksum(tmp_path, expected_checksum):
+        if not digest_matches(hasher.digest(), expected_checksum):
             tmp_path.unlink()
             print("Checksum verification failed! Update aborted.")
             sys.exit(1)
@@ -268,7 +453,7 @@ def update(
     # Replace binary
     print("Installing update...")
     try:
-        if platform.system() == "Windows":
+        if is_windows:
             # Windows: Can't replace running binary, rename to .old first
             old_path = binary_path.with_suffix(binary_path.suffix + ".old")
             if old_path.exists():
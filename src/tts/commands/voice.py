@@ -1,9 +1,15 @@
 """Voice management commands."""
 
+import hashlib
+import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated, BinaryIO, Literal
 
 import cyclopts
 from cyclopts import Parameter
@@ -12,45 +18,173 @@ from tts.common import get_fish_client, load_api_key
 
 app = cyclopts.App(name="voice", help="Manage voice models.")
 
-AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".ogg", ".m4a"}
+# Tuple so filenames can be matched with a single str.endswith call
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".m4a")
+# Only this many trailing characters can hold an audio extension
+_MAX_EXT_LEN = max(map(len, AUDIO_EXTENSIONS))
 
+# Upper bound on concurrent ffmpeg conversions during upload
+MAX_CONVERT_WORKERS = min(8, os.cpu_count() or 1)
 
-def find_audio_files(directory: Path) -> list[Path]:
-    """Find all audio files in the given directory."""
+
+def scan_samples(directory: Path) -> tuple[list[Path], dict[str, Path]]:
+    """Find audio files and index .txt transcripts by stem in one directory pass."""
+    names: list[str] = []
+    txt_index: dict[str, Path] = {}
     try:
-        entries = sorted(directory.iterdir())
+        # scandir's DirEntry answers is_file() from the directory listing
+        with os.scandir(directory) as it:
+            for e in it:
+                # Lowercase just the tail rather than the whole name
+                if e.name[-_MAX_EXT_LEN:].lower().endswith(AUDIO_EXTENSIONS):
+                    if e.is_file():
+                        names.append(e.name)
+                elif e.name.endswith(".txt") and e.is_file():
+                    txt_index[e.name[:-4]] = directory / e.name
     except OSError as e:
         print(f"Error reading directory {directory}: {e}")
         sys.exit(1)
 
-    return [f for f in entries if f.suffix.lower() in AUDIO_EXTENSIONS and f.is_file()]
+    names.sort()
+    return [directory / name for name in names], txt_index
+
+
+def find_audio_files(directory: Path) -> list[Path]:
+    """Find all audio files in the given directory."""
+    return scan_samples(directory)[0]
+
 
+def drop_duplicate_samples(audio_files: list[Path]) -> tuple[list[Path], list[str]]:
+    """Drop files whose content repeats an earlier file, returning (unique, notes).
 
-def convert_to_wav(audio_path: Path) -> bytes:
-    """Convert an audio file to WAV (PCM 16-bit) via ffmpeg, return wav bytes."""
+    Only files that share a size are hashed, so distinct samples cost a stat.
+    """
+    by_size: dict[int, list[Path]] = {}
+    for path in audio_files:
+        try:
+            by_size.setdefault(path.stat().st_size, []).append(path)
+        except OSError:
+            # Left in for _prepare_sample to report
+            pass
+
+    duplicates: dict[Path, Path] = {}
+    for same_size in by_size.values():
+        if len(same_size) < 2:
+            continue
+        first_seen: dict[bytes, Path] = {}
+        for path in same_size:
+            try:
+                with open(path, "rb") as f:
+                    digest = hashlib.file_digest(f, "blake2b").digest()
+            except OSError:
+                continue
+            original = first_seen.setdefault(digest, path)
+            if original is not path:
+                duplicates[path] = original
+
+    unique = [p for p in audio_files if p not in duplicates]
+    notes = [f"  {p.name} duplicates {o.name}, skipping" for p, o in duplicates.items()]
+    return unique, notes
+
+
+def convert_to_wav(
+    audio_path: Path,
+    dest: Path,
+    *,
+    sample_rate: int | None = None,
+    mono: bool = False,
+) -> Path:
+    """Convert an audio file to WAV (PCM 16-bit) at dest via ffmpeg, return dest.
+
+    The source sample rate and channels are kept unless overridden.
+    """
+    resample: list[str] = []
+    if sample_rate:
+        resample += ["-ar", str(sample_rate)]
+    if mono:
+        resample += ["-ac", "1"]
+    # Writing to a seekable file keeps the converted audio out of memory and
+    # lets ffmpeg fill in the real data size in the WAV header; -loglevel
+    # error keeps stderr down to the actual failure
     result = subprocess.run(
         [
             "ffmpeg",
+            "-nostdin",
+            "-loglevel",
+            "error",
             "-i",
             str(audio_path),
+            # Skip embedded cover art (an attached picture "video" stream)
+            "-vn",
+            *resample,
             "-f",
             "wav",
             "-acodec",
             "pcm_s16le",
-            "pipe:1",
+            "-y",
+            str(dest),
         ],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
     )
     if result.returncode != 0:
-        raise RuntimeError(result.stderr.decode().strip().splitlines()[-1])
-    return result.stdout
+        lines = result.stderr.decode(errors="replace").strip().splitlines()
+        raise RuntimeError(
+            lines[-1] if lines else f"ffmpeg exited with {result.returncode}"
+        )
+    return dest
 
 
-def read_transcript(audio_path: Path) -> str | None:
-    """Read a companion .txt transcript matching the audio file stem."""
-    txt_path = audio_path.with_suffix(".txt")
-    if not txt_path.exists():
-        return None
+def _needs_conversion(audio_path: Path, sample_rate: int | None, mono: bool) -> bool:
+    """Whether a sample must go through ffmpeg before upload."""
+    return bool(sample_rate or mono) or audio_path.suffix.lower() != ".wav"
+
+
+def _prepare_sample(
+    audio_path: Path,
+    work_dir: Path,
+    *,
+    sample_rate: int | None = None,
+    mono: bool = False,
+) -> tuple[Path | None, str | None]:
+    """Get a WAV file to upload for one sample, returning (path, error).
+
+    WAV files are used as-is unless resampling is requested; everything else
+    is converted into work_dir.
+    """
+    try:
+        if not _needs_conversion(audio_path, sample_rate, mono):
+            sample = audio_path
+        else:
+            # The full name keeps a.mp3 and a.flac from colliding
+            sample = convert_to_wav(
+                audio_path,
+                work_dir / f"{audio_path.name}.wav",
+                sample_rate=sample_rate,
+                mono=mono,
+            )
+        if sample.stat().st_size == 0:
+            return None, f"  {audio_path.name} is empty, skipping"
+    except (OSError, RuntimeError) as e:
+        return None, f"  Could not read {audio_path.name}: {e}"
+    return sample, None
+
+
+def read_transcript(
+    audio_path: Path, txt_index: dict[str, Path] | None = None
+) -> str | None:
+    """Read a companion .txt transcript matching the audio file stem.
+
+    With a txt_index from scan_samples, the lookup needs no filesystem check.
+    """
+    if txt_index is None:
+        txt_path = audio_path.with_suffix(".txt")
+        if not txt_path.exists():
+            return None
+    else:
+        txt_path = txt_index.get(audio_path.stem)
+        if txt_path is None:
+            return None
     try:
         content = txt_path.read_text(encoding="utf-8").strip()
     except OSError as e:
@@ -78,6 +212,11 @@ def upload(
     tags: Annotated[
         list[str] | None, Parameter(help="Tags for the voice model")
     ] = None,
+    sample_rate: Annotated[
+        int | None,
+        Parameter(help="Resample every sample to this rate in Hz (e.g. 22050)"),
+    ] = None,
+    mono: Annotated[bool, Parameter(help="Downmix every sample to mono")] = False,
     env_file: Annotated[
         Path | None, Parameter(name="--env-file", help="Path to .env file")
     ] = None,
@@ -90,83 +229,139 @@ def upload(
         print(f"Error: {directory} is not a directory")
         sys.exit(1)
 
-    audio_files = find_audio_files(directory)
+    if sample_rate is not None and sample_rate <= 0:
+        print("Error: Sample rate must be a positive number of Hz")
+        sys.exit(1)
+
+    audio_files, txt_index = scan_samples(directory)
     if not audio_files:
         print(f"No audio files found in {directory}")
         sys.exit(1)
 
     print(f"Found {len(audio_files)} audio file(s) in {directory}")
 
-    voices: list[bytes] = []
-    texts: list[str] = []
-    all_have_transcripts = True
-    errors: list[str] = []
-
-    for audio_path in audio_files:
-        try:
-            if audio_path.suffix.lower() == ".wav":
-                audio_bytes = audio_path.read_bytes()
-            else:
-                audio_bytes = convert_to_wav(audio_path)
-        except (OSError, RuntimeError) as e:
-            errors.append(f"  Could not read {audio_path.name}: {e}")
-            continue
-
-        if not audio_bytes:
-            errors.append(f"  {audio_path.name} is empty, skipping")
-            continue
-
-        transcript = read_transcript(audio_path)
-        voices.append(audio_bytes)
-
-        if transcript:
-            texts.append(transcript)
-            print(f"  {audio_path.name} -> {audio_path.stem}.txt")
-        else:
-            all_have_transcripts = False
-            print(f"  {audio_path.name}")
-
-    if errors:
-        print("\nSkipped files:")
-        for err in errors:
-            print(err)
+    # Re-uploading the same clip under another name only wastes bandwidth
+    audio_files, duplicates = drop_duplicate_samples(audio_files)
+    if duplicates:
+        print("\nSkipped duplicates:")
+        for note in duplicates:
+            print(note)
+
+    with tempfile.TemporaryDirectory(prefix="tts-voice-") as work_dir:
+        _upload_samples(
+            client,
+            audio_files,
+            txt_index,
+            Path(work_dir),
+            title=title,
+            description=description,
+            enhance=enhance,
+            visibility=visibility,
+            tags=tags,
+            sample_rate=sample_rate,
+            mono=mono,
+        )
 
-    if not voices:
-        print("\nError: no valid audio files to upload.")
-        sys.exit(1)
 
-    if texts and not all_have_transcripts:
-        print("\nWarning: some files have transcripts and some don't.")
-        print(
-            "Provide transcripts for ALL files or none. Ignoring partial transcripts."
+def _upload_samples(
+    client,
+    audio_files: list[Path],
+    txt_index: dict[str, Path],
+    work_dir: Path,
+    *,
+    title: str,
+    description: str,
+    enhance: bool,
+    visibility: str,
+    tags: list[str] | None,
+    sample_rate: int | None = None,
+    mono: bool = False,
+) -> None:
+    """Convert samples into work_dir as needed and create the voice model."""
+    with ExitStack() as stack:
+        # Samples stay on disk and are streamed into the request body
+        voices: list[BinaryIO] = []
+        texts: list[str] = []
+        all_have_transcripts = True
+        errors: list[str] = []
+
+        # ffmpeg runs in subprocesses, so conversions overlap across threads;
+        # WAV samples only need a stat and skip the pool
+        prepare = partial(
+            _prepare_sample, work_dir=work_dir, sample_rate=sample_rate, mono=mono
         )
-        texts = []
-
-    print(f"\nCreating voice model: {title}")
-    if description:
-        print(f"Description: {description}")
-    if enhance:
-        print("Audio enhancement: enabled")
-    print(f"Visibility: {visibility}")
-
-    create_kwargs: dict = {
-        "title": title,
-        "voices": voices,
-        "description": description,
-        "enhance_audio_quality": enhance,
-        "visibility": visibility,
-    }
-    if texts:
-        create_kwargs["texts"] = texts
-    if tags:
-        create_kwargs["tags"] = tags
+        to_convert = [p for p in audio_files if _needs_conversion(p, sample_rate, mono)]
+        converted: dict[Path, tuple[Path | None, str | None]] = {}
+        if to_convert:
+            workers = min(MAX_CONVERT_WORKERS, len(to_convert))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                converted = dict(zip(to_convert, pool.map(prepare, to_convert)))
+
+        for audio_path in audio_files:
+            sample, error = converted.get(audio_path) or prepare(audio_path)
+            if error:
+                errors.append(error)
+                continue
+            try:
+                # Opened now so an unreadable sample is skipped, not fatal
+                # to the upload
+                voices.append(stack.enter_context(open(sample, "rb")))
+            except OSError as e:
+                errors.append(f"  Could not read {audio_path.name}: {e}")
+                continue
+
+            transcript = read_transcript(audio_path, txt_index)
+
+            if transcript:
+                texts.append(transcript)
+                print(f"  {audio_path.name} -> {audio_path.stem}.txt")
+            else:
+                all_have_transcripts = False
+                print(f"  {audio_path.name}")
+
+        if errors:
+            print("\nSkipped files:")
+            for err in errors:
+                print(err)
+
+        if not voices:
+            print("\nError: no valid audio files to upload.")
+            sys.exit(1)
+
+        if texts and not all_have_transcripts:
+            print("\nWarning: some files have transcripts and some don't.")
+            print(
+                "Provide transcripts for ALL files or none. Ignoring partial transcripts."
+            )
+            texts = []
+
+        print(f"\nCreating voice model: {title}")
+        if description:
+            print(f"Description: {description}")
+        if enhance:
+            print("Audio enhancement: enabled")
+        print(f"Visibility: {visibility}")
+
+        create_kwargs: dict = {
+            "title": title,
+            "description": description,
+            # Typed as list[bytes], but the SDK hands each item to httpx's
+            # files=, which streams file objects in chunks
+            "voices": voices,
+            "enhance_audio_quality": enhance,
+            "visibility": visibility,
+        }
+        if texts:
+            create_kwargs["texts"] = texts
+        if tags:
+            create_kwargs["tags"] = tags
 
-    try:
-        voice = client.voices.create(**create_kwargs)
-        print(f"\nVoice model created: {voice.id}")
-    except Exception as e:
-        print(f"\nError creating voice model: {e}")
-        sys.exit(1)
+        try:
+            voice = client.voices.create(**create_kwargs)
+            print(f"\nVoice model created: {voice.id}")
+        except Exception as e:
+            print(f"\nError creating voice model: {e}")
+            sys.exit(1)
 
 
 def _list_voices(env_file: Path | None = None) -> None:
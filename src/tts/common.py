@@ -1,6 +1,8 @@
 """Shared utilities for TTS CLI."""
 
+import functools
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -11,18 +13,33 @@ CREDENTIALS_FILE = CONFIG_DIR / "credentials"
 KEYRING_SERVICE = "tts-cli"
 KEYRING_USERNAME = "api-key"
 
+# Keyring lookups (including misses) by (service, username); each lookup can
+# be an IPC round-trip to the OS secret store
+_keyring_cache: dict[tuple[str, str], str | None] = {}
 
+# Parsed env files by (absolute path, mtime_ns, size)
+_env_parse_cache: dict[tuple[str, int, int], dict[str, str]] = {}
+
+# One KEY=VALUE assignment per line; comment lines can't match the key group
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=(.*)$", re.MULTILINE)
+
+
+@functools.cache
 def _keyring_available() -> bool:
-    """Check if keyring is available and functional."""
+    """Check if keyring is available and functional.
+
+    The backend probe can be slow (e.g. macOS Keychain), so it runs once per
+    process; use `_keyring_available.cache_clear()` to re-probe.
+    """
     try:
         import keyring
-        from keyring.errors import NoKeyringError
+    except ImportError:
+        return False
 
+    try:
         # Test if a keyring backend is available
         keyring.get_keyring()
         return True
-    except (ImportError, NoKeyringError):
-        return False
     except Exception:
         return False
 
@@ -32,12 +49,18 @@ def get_api_key_from_keyring() -> str | None:
     if not _keyring_available():
         return None
 
+    cache_key = (KEYRING_SERVICE, KEYRING_USERNAME)
+    if cache_key in _keyring_cache:
+        return _keyring_cache[cache_key]
+
     try:
         import keyring
 
-        return keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+        key = keyring.get_password(*cache_key)
     except Exception:
-        return None
+        key = None
+    _keyring_cache[cache_key] = key
+    return key
 
 
 def set_api_key_in_keyring(api_key: str) -> bool:
@@ -49,8 +72,10 @@ def set_api_key_in_keyring(api_key: str) -> bool:
         import keyring
 
         keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, api_key)
+        _keyring_cache[(KEYRING_SERVICE, KEYRING_USERNAME)] = api_key
         return True
     except Exception:
+        _keyring_cache.pop((KEYRING_SERVICE, KEYRING_USERNAME), None)
         return False
 
 
@@ -63,30 +88,65 @@ def delete_api_key_from_keyring() -> bool:
         import keyring
 
         keyring.delete_password(KEYRING_SERVICE, KEYRING_USERNAME)
+        _keyring_cache[(KEYRING_SERVICE, KEYRING_USERNAME)] = None
         return True
     except Exception:
+        _keyring_cache.pop((KEYRING_SERVICE, KEYRING_USERNAME), None)
         return False
 
 
-def load_env_file(path: Path) -> None:
-    """Load KEY=VALUE pairs from a file into os.environ (won't override existing)."""
+def _unquote_value(value: str) -> str:
+    """Strip surrounding whitespace and one matching pair of quotes."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _read_credentials_key() -> str | None:
+    """Read FISH_API_KEY from the credentials file, or None if unset.
+
+    Lines are parsed the same way as load_env_file; the first assignment wins.
+    """
+    try:
+        content = CREDENTIALS_FILE.read_bytes().decode("utf-8", "replace")
+    except OSError:
+        return None
+    for match in _ENV_LINE_RE.finditer(content):
+        if match.group(1) == "FISH_API_KEY":
+            return _unquote_value(match.group(2)) or None
+    return None
+
+
+def load_env_file(path: Path, *, missing_ok: bool = False) -> None:
+    """Load KEY=VALUE pairs from a file into os.environ (won't override existing).
+
+    Parsed files are reused while their mtime and size are unchanged. With
+    missing_ok, a path that doesn't exist (or isn't a file) is skipped.
+    """
+    # Checked up front: a directory can fail to open with PermissionError
+    # (Windows) rather than IsADirectoryError
+    if missing_ok and not path.is_file():
+        return
     try:
-        content = path.read_text(encoding="utf-8")
+        st = path.stat()
+        cache_key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        parsed = _env_parse_cache.get(cache_key)
+        if parsed is None:
+            # One read and one decode; stray bytes shouldn't abort the whole file
+            content = path.read_bytes().decode("utf-8", "replace")
     except OSError as e:
         print(f"Error: could not read env file {path}: {e}")
         sys.exit(1)
 
-    for line in content.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, _, value = line.partition("=")
-        key = key.strip()
-        value = value.strip().strip("\"'")
-        if key and key not in os.environ:
-            os.environ[key] = value
+    if parsed is None:
+        parsed = {}
+        for match in _ENV_LINE_RE.finditer(content):
+            # First assignment of a key wins, as with the environment itself
+            parsed.setdefault(match.group(1), _unquote_value(match.group(2)))
+        _env_parse_cache[cache_key] = parsed
+
+    os.environ.update({k: v for k, v in parsed.items() if k not in os.environ})
 
 
 def load_api_key(env_file: Path | None = None) -> None:
@@ -105,10 +165,9 @@ def load_api_key(env_file: Path | None = None) -> None:
         return
 
     # Try user config directory
-    if CREDENTIALS_FILE.is_file():
-        load_env_file(CREDENTIALS_FILE)
-        if os.environ.get("FISH_API_KEY"):
-            return
+    if key := _read_credentials_key():
+        os.environ["FISH_API_KEY"] = key
+        return
 
     # Try .env file
     env_path = env_file or Path(".env")
@@ -117,8 +176,8 @@ def load_api_key(env_file: Path | None = None) -> None:
             print(f"Error: env file not found: {env_path}")
             sys.exit(1)
         load_env_file(env_path)
-    elif env_path.is_file():
-        load_env_file(env_path)
+    else:
+        load_env_file(env_path, missing_ok=True)
 
 
 def require_api_key() -> None:
@@ -135,13 +194,21 @@ def require_api_key() -> None:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
+def _create_fish_client(api_key: str):
+    """Create the Fish Audio client once per API key, reusing its connection pool."""
+    from fishaudio import FishAudio
+
+    return FishAudio(api_key=api_key)
+
+
 def get_fish_client():
     """Get Fish Audio client, exit if not available."""
     try:
-        from fishaudio import FishAudio
+        import fishaudio  # noqa: F401
     except ImportError:
         print("Error: fish-audio-sdk not installed.")
         sys.exit(1)
 
     require_api_key()
-    return FishAudio()
+    return _create_fish_client(os.environ["FISH_API_KEY"])
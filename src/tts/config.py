@@ -1,17 +1,23 @@
 """Configuration management for TTS CLI."""
 
-import tomllib
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import Literal
 
 CONFIG_DIR = Path.home() / ".config" / "tts"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
+# Last parsed config, keyed by (path, mtime_ns, size) of the file it came from
+_cached_config: tuple[tuple[Path, int, int], "TTSConfig"] | None = None
 
-@dataclass
+
+# Output formats accepted by the Fish Audio API
+_VALID_FORMATS = frozenset({"mp3", "wav", "pcm"})
+
+
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
-    """TTS CLI configuration."""
+    """TTS CLI configuration (immutable; use dataclasses.replace to change)."""
 
     default_voice: str | None = None
     output_dir: str = "./audio_output"
@@ -20,63 +26,101 @@ class TTSConfig:
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
-        if self.format not in ("mp3", "wav", "pcm"):
+        if self.format not in _VALID_FORMATS:
             raise ValueError(f"Invalid format: {self.format}")
         if not 0.5 <= self.speed <= 2.0:
             raise ValueError(f"Speed must be between 0.5 and 2.0: {self.speed}")
 
 
+# Shared defaults; safe to hand out because TTSConfig is frozen
+_DEFAULT_CONFIG = TTSConfig()
+
+# Keys load_config accepts from the TOML file
+_VALID_FIELDS = frozenset(f.name for f in fields(TTSConfig))
+
+
 def load_config() -> TTSConfig:
-    """Load configuration from file, returning defaults if not found."""
-    if not CONFIG_FILE.is_file():
-        return TTSConfig()
+    """Load configuration from file, returning defaults if not found.
+
+    The parsed result is reused while the file's mtime and size are unchanged.
+    """
+    global _cached_config
 
     try:
-        content = CONFIG_FILE.read_text(encoding="utf-8")
-        data = tomllib.loads(content)
-    except (OSError, tomllib.TOMLDecodeError):
-        return TTSConfig()
+        st = CONFIG_FILE.stat()
+    except OSError:
+        _cached_config = None
+        return _DEFAULT_CONFIG
+    key = (CONFIG_FILE, st.st_mtime_ns, st.st_size)
+    if _cached_config and _cached_config[0] == key:
+        return _cached_config[1]
+
+    # Only a successful parse of the current file is cached
+    _cached_config = None
+
+    import tomllib
 
-    # Extract only known fields
-    valid_fields = {f.name for f in fields(TTSConfig)}
-    filtered = {k: v for k, v in data.items() if k in valid_fields}
+    try:
+        content = CONFIG_FILE.read_bytes().decode("utf-8")
+        data = tomllib.loads(content)
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+        return _DEFAULT_CONFIG
 
     try:
-        return TTSConfig(**filtered)
+        # Extract only known fields
+        config = TTSConfig(**{k: data[k] for k in data.keys() & _VALID_FIELDS})
     except (TypeError, ValueError):
-        return TTSConfig()
+        return _DEFAULT_CONFIG
 
+    _cached_config = (key, config)
+    return config
 
-def save_config(config: TTSConfig) -> None:
-    """Save configuration to file."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
+def _render_toml(config: TTSConfig) -> str:
+    """Serialize a config to the TOML text written by save_config."""
     lines = []
     if config.default_voice is not None:
         lines.append(f'default_voice = "{config.default_voice}"')
     lines.append(f'output_dir = "{config.output_dir}"')
     lines.append(f'format = "{config.format}"')
     lines.append(f"speed = {config.speed}")
+    return "\n".join(lines) + "\n"
 
-    CONFIG_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
+def save_config(config: TTSConfig) -> None:
+    """Save configuration to file."""
+    global _cached_config
 
-def update_config(**kwargs) -> TTSConfig:
-    """Update specific config values and save."""
-    config = load_config()
+    _cached_config = None
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+    CONFIG_FILE.write_text(_render_toml(config), encoding="utf-8")
 
-    for key, value in kwargs.items():
-        if hasattr(config, key):
-            setattr(config, key, value)
 
-    # Validate the updated config
-    config.__post_init__()
-    save_config(config)
+def update_config(**kwargs) -> TTSConfig:
+    """Update specific config values and save.
+
+    The file is left untouched when it already holds the resulting values.
+    """
+    current = load_config()
+    # Set by load_config only when the current file parsed cleanly
+    on_disk = _cached_config[1] if _cached_config else None
+
+    # replace() re-runs validation on the updated values
+    config = replace(current, **{k: v for k, v in kwargs.items() if k in _VALID_FIELDS})
+    if config != on_disk:
+        save_config(config)
     return config
 
 
 def reset_config() -> TTSConfig:
-    """Reset configuration to defaults."""
-    config = TTSConfig()
-    save_config(config)
-    return config
+    """Reset configuration to defaults.
+
+    The config file is removed rather than rewritten; load_config already
+    returns the defaults when it is missing.
+    """
+    global _cached_config
+
+    _cached_config = None
+    CONFIG_FILE.unlink(missing_ok=True)
+    return _DEFAULT_CONFIG
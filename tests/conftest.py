@@ -4,6 +4,8 @@ import os
 import pytest
 from pathlib import Path
 
+from fishaudio import FishAudio
+
 
 @pytest.fixture(autouse=True)
 def clean_env(monkeypatch):
@@ -11,11 +13,38 @@ def clean_env(monkeypatch):
     monkeypatch.delenv("FISH_API_KEY", raising=False)
 
 
-@pytest.fixture
-def temp_config_dir(tmp_path, monkeypatch):
-    """Override config directory to temp path in all modules."""
-    config_dir = tmp_path / ".config" / "tts"
-    config_dir.mkdir(parents=True)
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset per-process caches so each test sees fresh state."""
+    import tts.config
+    from tts.commands.update import get_platform_binary
+    from tts.common import (
+        _create_fish_client,
+        _env_parse_cache,
+        _keyring_available,
+        _keyring_cache,
+    )
+
+    caches = (
+        _create_fish_client,
+        _keyring_available,
+        get_platform_binary,
+    )
+    for cached in caches:
+        cached.cache_clear()
+    _keyring_cache.clear()
+    _env_parse_cache.clear()
+    tts.config._cached_config = None
+    yield
+    for cached in caches:
+        cached.cache_clear()
+    _keyring_cache.clear()
+    _env_parse_cache.clear()
+    tts.config._cached_config = None
+
+
+def _redirect_config(monkeypatch, config_dir: Path) -> None:
+    """Point every module's config and credentials paths into config_dir."""
     creds_file = config_dir / "credentials"
     config_file = config_dir / "config.toml"
 
@@ -32,14 +61,34 @@ def temp_config_dir(tmp_path, monkeypatch):
     monkeypatch.setattr("tts.commands.configure.CREDENTIALS_FILE", creds_file)
     monkeypatch.setattr("tts.commands.configure.CONFIG_FILE", config_file)
 
+
+@pytest.fixture(autouse=True)
+def isolate_config(tmp_path, monkeypatch):
+    """Keep every test away from the real config, credentials and cwd.
+
+    The config directory is not created; use temp_config_dir for that.
+    """
+    _redirect_config(monkeypatch, tmp_path / ".config" / "tts")
+    # Relative outputs and the implicit .env lookup stay inside tmp_path
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def temp_config_dir(tmp_path):
+    """Create the (already redirected) config directory under tmp_path."""
+    config_dir = tmp_path / ".config" / "tts"
+    config_dir.mkdir(parents=True)
     return config_dir
 
 
 @pytest.fixture
-def mock_fish_client(mocker):
-    """Mock the Fish Audio client."""
-    mock_client = mocker.MagicMock()
-    mocker.patch("tts.common.FishAudio", return_value=mock_client)
+def mock_fish_client(mocker, monkeypatch):
+    """Mock the Fish Audio client, with an API key set so it can be created."""
+    monkeypatch.setenv("FISH_API_KEY", "test-key")
+    # spec_set makes a misspelled client attribute fail instead of passing silently
+    mock_client = mocker.MagicMock(spec_set=FishAudio)
+    mock_client.tts.convert.return_value = b"audio"
+    mocker.patch("fishaudio.FishAudio", return_value=mock_client)
     return mock_client
 
 
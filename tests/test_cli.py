@@ -1,9 +1,11 @@
 """Tests for main CLI application."""
 
+import sys
+
 import pytest
 
 from tts import __version__
-from tts.cli import app
+from tts.cli import app, main
 
 
 class TestCLIHelp:
@@ -25,6 +27,20 @@ class TestCLIHelp:
         assert "update" in output
         assert "voice" in output
 
+    def test_help_does_not_import_command_modules(self, capsys, monkeypatch):
+        """Top-level help should not import any subcommand module."""
+        # GIVEN no command modules have been imported yet
+        for name in list(sys.modules):
+            if name.startswith("tts.commands."):
+                monkeypatch.delitem(sys.modules, name)
+
+        # WHEN help is requested
+        with pytest.raises(SystemExit):
+            app(["--help"])
+
+        # THEN no command module should have been loaded
+        assert not [m for m in sys.modules if m.startswith("tts.commands.")]
+
     def test_version_output(self, capsys):
         """Version flag should print current version."""
         # GIVEN the CLI app
@@ -37,6 +53,36 @@ class TestCLIHelp:
         output = capsys.readouterr().out
         assert __version__ in output
 
+    def test_short_version_flag_not_registered(self, capsys):
+        """-v should not act as a version flag after a subcommand."""
+        # GIVEN the CLI app
+        # WHEN -v is passed to a subcommand
+        with pytest.raises(SystemExit) as exc_info:
+            app(["update", "-v"])
+
+        # THEN it should be rejected rather than print the version
+        assert exc_info.value.code != 0
+        assert __version__ not in capsys.readouterr().out
+
+
+class TestMain:
+    """Test the CLI entry point."""
+
+    @pytest.mark.parametrize("flag", ["--version", "-v"])
+    def test_version_fast_path_skips_app(self, flag, mocker, monkeypatch, capsys):
+        """Version flag should print the version without building the app."""
+        # GIVEN argv requesting only the version
+        monkeypatch.setattr("sys.argv", ["tts", flag])
+        get_app = mocker.patch("tts.cli._get_app")
+
+        # WHEN main is called
+        main()
+
+        # THEN the version should be printed
+        assert capsys.readouterr().out.strip() == __version__
+        # AND the cyclopts app should never be built
+        get_app.assert_not_called()
+
 
 class TestSubcommandHelp:
     """Test help output for subcommands."""
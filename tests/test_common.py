@@ -12,6 +12,7 @@ from tts.common import (
     get_api_key_from_keyring,
     set_api_key_in_keyring,
     delete_api_key_from_keyring,
+    get_fish_client,
 )
 
 
@@ -74,6 +75,21 @@ class TestLoadEnvFile:
         assert os.environ.get("DOUBLE") == "double_quoted"
         assert os.environ.get("SINGLE") == "single_quoted"
 
+    def test_keeps_unmatched_quotes(self, tmp_path, monkeypatch):
+        """Should only strip a matching pair of surrounding quotes."""
+        # GIVEN values with mismatched and inner quotes
+        env_file = tmp_path / ".env"
+        env_file.write_text("MIXED=\"hello'\nINNER='\"quoted\"'\n")
+        monkeypatch.delenv("MIXED", raising=False)
+        monkeypatch.delenv("INNER", raising=False)
+
+        # WHEN load_env_file is called
+        load_env_file(env_file)
+
+        # THEN values should keep quotes that are not a matching outer pair
+        assert os.environ.get("MIXED") == "\"hello'"
+        assert os.environ.get("INNER") == '"quoted"'
+
     def test_does_not_override_existing(self, tmp_path, monkeypatch):
         """Should not override existing environment variables."""
         # GIVEN an existing environment variable
@@ -87,6 +103,60 @@ class TestLoadEnvFile:
         # THEN existing value should remain
         assert os.environ.get("EXISTING") == "original"
 
+    def test_reuses_parse_of_unchanged_file(self, tmp_path, monkeypatch, mocker):
+        """Should not re-read a file that hasn't changed since the last load."""
+        # GIVEN an env file that has been loaded once
+        env_file = tmp_path / ".env"
+        env_file.write_text("KEY=value\n")
+        monkeypatch.delenv("KEY", raising=False)
+        load_env_file(env_file)
+        monkeypatch.delenv("KEY")
+        read_bytes = mocker.patch.object(Path, "read_bytes")
+
+        # WHEN it is loaded again
+        load_env_file(env_file)
+
+        # THEN values should come from the cached parse
+        assert os.environ.get("KEY") == "value"
+        read_bytes.assert_not_called()
+
+    def test_skips_missing_file_when_allowed(self, tmp_path):
+        """Should silently skip a missing file with missing_ok."""
+        # GIVEN a path that does not exist
+        env_file = tmp_path / "missing.env"
+
+        # WHEN load_env_file is called with missing_ok
+        # THEN it should return without exiting
+        load_env_file(env_file, missing_ok=True)
+
+    def test_skips_directory_when_allowed(self, tmp_path, mocker):
+        """Should skip a directory with missing_ok, however opening it fails."""
+        # GIVEN a .env directory that fails to open as on Windows
+        env_dir = tmp_path / ".env"
+        env_dir.mkdir()
+        read_bytes = mocker.patch.object(
+            Path, "read_bytes", side_effect=PermissionError("Permission denied")
+        )
+
+        # WHEN load_env_file is called with missing_ok
+        load_env_file(env_dir, missing_ok=True)
+
+        # THEN it should return without reading or exiting
+        read_bytes.assert_not_called()
+
+    def test_tolerates_invalid_utf8(self, tmp_path, monkeypatch):
+        """Should load valid lines even if the file has undecodable bytes."""
+        # GIVEN an env file with a stray non-UTF-8 byte
+        env_file = tmp_path / ".env"
+        env_file.write_bytes(b"# caf\xe9\nKEY=value\n")
+        monkeypatch.delenv("KEY", raising=False)
+
+        # WHEN load_env_file is called
+        load_env_file(env_file)
+
+        # THEN the valid line should be loaded
+        assert os.environ.get("KEY") == "value"
+
     def test_exits_on_read_error(self, tmp_path):
         """Should exit when file cannot be read."""
         # GIVEN a non-existent file
@@ -107,8 +177,22 @@ class TestKeyringFunctions:
         # GIVEN keyring import fails
         mocker.patch.dict("sys.modules", {"keyring": None})
 
-        # Note: _keyring_available caches the result, so we test behavior
-        # The actual implementation catches ImportError
+        # WHEN availability is checked
+        # THEN it should report False
+        assert _keyring_available() is False
+
+    def test_keyring_probe_runs_once(self, mocker):
+        """Should probe the keyring backend only once per process."""
+        # GIVEN a keyring module whose backend probe is observable
+        mock_keyring = mocker.MagicMock()
+        mocker.patch.dict("sys.modules", {"keyring": mock_keyring})
+
+        # WHEN availability is checked twice
+        _keyring_available()
+        _keyring_available()
+
+        # THEN the backend should be probed once
+        mock_keyring.get_keyring.assert_called_once()
 
     def test_get_api_key_from_keyring_when_unavailable(self, mocker):
         """Should return None when keyring unavailable."""
@@ -143,6 +227,38 @@ class TestKeyringFunctions:
         # THEN should return False
         assert result is False
 
+    def test_memoizes_keyring_lookups(self, mocker):
+        """Should query the keyring once, caching misses too."""
+        # GIVEN an available keyring with no stored key
+        mocker.patch("tts.common._keyring_available", return_value=True)
+        mock_keyring = mocker.MagicMock()
+        mock_keyring.get_password.return_value = None
+        mocker.patch.dict("sys.modules", {"keyring": mock_keyring})
+
+        # WHEN getting the key twice
+        first = get_api_key_from_keyring()
+        second = get_api_key_from_keyring()
+
+        # THEN the keyring should be queried once
+        assert first is None and second is None
+        mock_keyring.get_password.assert_called_once()
+
+    def test_set_updates_cached_lookup(self, mocker):
+        """Storing a key should be visible to later lookups."""
+        # GIVEN a cached miss
+        mocker.patch("tts.common._keyring_available", return_value=True)
+        mock_keyring = mocker.MagicMock()
+        mock_keyring.get_password.return_value = None
+        mocker.patch.dict("sys.modules", {"keyring": mock_keyring})
+        get_api_key_from_keyring()
+
+        # WHEN a key is stored
+        set_api_key_in_keyring("new-key")
+
+        # THEN the lookup should return it without re-querying
+        assert get_api_key_from_keyring() == "new-key"
+        mock_keyring.get_password.assert_called_once()
+
 
 class TestLoadApiKey:
     """Tests for load_api_key function."""
@@ -186,6 +302,41 @@ class TestLoadApiKey:
         # THEN key should be loaded
         assert os.environ.get("FISH_API_KEY") == "creds-key"
 
+    def test_loads_quoted_key_with_crlf(self, temp_config_dir, mocker):
+        """Should unquote the key and ignore a trailing carriage return."""
+        # GIVEN a hand-edited credentials file with a quoted key and CRLF
+        creds_file = temp_config_dir / "credentials"
+        creds_file.write_bytes(b'# tts\r\nFISH_API_KEY="creds-key"\r\n')
+        mocker.patch("tts.common.get_api_key_from_keyring", return_value=None)
+
+        # WHEN load_api_key is called
+        load_api_key()
+
+        # THEN the bare key should be loaded
+        assert os.environ.get("FISH_API_KEY") == "creds-key"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "#FISH_API_KEY=old-key\nFISH_API_KEY=creds-key\n",
+            "OTHER_FISH_API_KEY=other-key\nFISH_API_KEY=creds-key\n",
+            "FISH_API_KEY = creds-key\n",
+            "  FISH_API_KEY=creds-key\n",
+        ],
+        ids=["commented-out", "prefixed-key", "spaced-equals", "indented"],
+    )
+    def test_finds_key_line_among_others(self, temp_config_dir, mocker, content):
+        """Should find the key on its own line, as load_env_file would."""
+        # GIVEN a hand-edited credentials file
+        (temp_config_dir / "credentials").write_text(content)
+        mocker.patch("tts.common.get_api_key_from_keyring", return_value=None)
+
+        # WHEN load_api_key is called
+        load_api_key()
+
+        # THEN the real key should be loaded
+        assert os.environ.get("FISH_API_KEY") == "creds-key"
+
     def test_loads_from_env_file(self, tmp_path, monkeypatch, mocker):
         """Should load API key from specified .env file."""
         # GIVEN a .env file with API key
@@ -270,3 +421,35 @@ class TestRequireApiKey:
         output = capsys.readouterr().out
         assert "FISH_API_KEY" in output
         assert "configure" in output
+
+
+class TestGetFishClient:
+    """Tests for get_fish_client function."""
+
+    def test_reuses_client_for_same_key(self, monkeypatch, mocker):
+        """Should build one client per API key and reuse it."""
+        # GIVEN an API key and a mocked SDK
+        monkeypatch.setenv("FISH_API_KEY", "key-1")
+        fish_cls = mocker.patch("fishaudio.FishAudio")
+
+        # WHEN get_fish_client is called twice
+        first = get_fish_client()
+        second = get_fish_client()
+
+        # THEN the same client should be returned
+        assert first is second
+        fish_cls.assert_called_once_with(api_key="key-1")
+
+    def test_new_client_when_key_changes(self, monkeypatch, mocker):
+        """Should build a fresh client when the API key changes."""
+        # GIVEN a client created for one key
+        monkeypatch.setenv("FISH_API_KEY", "key-1")
+        fish_cls = mocker.patch("fishaudio.FishAudio")
+        get_fish_client()
+
+        # WHEN the key changes
+        monkeypatch.setenv("FISH_API_KEY", "key-2")
+        get_fish_client()
+
+        # THEN a second client should be created
+        assert fish_cls.call_count == 2
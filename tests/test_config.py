@@ -1,5 +1,7 @@
 """Tests for config module."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pathlib import Path
 
@@ -125,6 +127,47 @@ unknown_field = "ignored"
         # THEN known field should be loaded
         assert config.default_voice == "voice-123"
 
+    def test_reuses_parse_while_file_unchanged(self, temp_config_dir, mocker):
+        """Should not re-parse the file until it changes."""
+        # GIVEN a config file that has been loaded once
+        config_file = temp_config_dir / "config.toml"
+        config_file.write_text('format = "wav"\n')
+        load_config()
+        loads = mocker.patch("tomllib.loads", side_effect=AssertionError)
+
+        # WHEN loading config again
+        config = load_config()
+
+        # THEN the cached values should be returned without parsing
+        assert config.format == "wav"
+        loads.assert_not_called()
+
+    def test_reloads_after_external_edit(self, temp_config_dir):
+        """Should pick up changes made to the file outside the CLI."""
+        # GIVEN a config file that has been loaded once
+        config_file = temp_config_dir / "config.toml"
+        config_file.write_text('format = "wav"\n')
+        load_config()
+
+        # WHEN the file is edited externally
+        config_file.write_text('format = "pcm"\nspeed = 1.5\n')
+
+        # THEN the new values should be loaded
+        assert load_config().format == "pcm"
+
+    def test_cached_config_is_immutable(self, temp_config_dir):
+        """A loaded config can't be mutated, so sharing the cached one is safe."""
+        # GIVEN a loaded config
+        (temp_config_dir / "config.toml").write_text('format = "wav"\n')
+        config = load_config()
+
+        # WHEN the returned object is mutated
+        # THEN it should refuse
+        with pytest.raises(FrozenInstanceError):
+            config.format = "pcm"
+        # AND a fresh load should be unaffected
+        assert load_config().format == "wav"
+
 
 class TestSaveConfig:
     """Tests for save_config function."""
@@ -209,6 +252,30 @@ class TestUpdateConfig:
         # THEN change should persist
         assert config.default_voice == "voice-789"
 
+    def test_skips_write_when_unchanged(self, temp_config_dir, mocker):
+        """Should not rewrite the file when values are already set."""
+        # GIVEN a saved config
+        update_config(format="wav")
+        save = mocker.patch("tts.config.save_config")
+
+        # WHEN updating to the same value
+        config = update_config(format="wav")
+
+        # THEN nothing should be written
+        assert config.format == "wav"
+        save.assert_not_called()
+
+    def test_writes_defaults_when_no_file(self, temp_config_dir):
+        """Should create the file even when values match the defaults."""
+        # GIVEN no config file
+        config_file = temp_config_dir / "config.toml"
+
+        # WHEN setting a value equal to its default
+        update_config(format="mp3")
+
+        # THEN the file should be created
+        assert config_file.is_file()
+
 
 class TestResetConfig:
     """Tests for reset_config function."""
@@ -236,3 +303,23 @@ class TestResetConfig:
 
         # THEN defaults should persist
         assert config.format == "mp3"
+
+    def test_removes_config_file(self, temp_config_dir):
+        """Should delete the config file instead of rewriting it."""
+        # GIVEN a custom config
+        save_config(TTSConfig(format="wav"))
+
+        # WHEN resetting
+        reset_config()
+
+        # THEN no config file should remain
+        assert not (temp_config_dir / "config.toml").exists()
+
+    def test_missing_file_is_fine(self, temp_config_dir):
+        """Should succeed when there is no config file."""
+        # GIVEN no config file
+        # WHEN resetting
+        config = reset_config()
+
+        # THEN defaults should be returned
+        assert config == TTSConfig()
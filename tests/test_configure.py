@@ -3,53 +3,72 @@
 import pytest
 from pathlib import Path
 
+import tts.config
+from tts.config import TTSConfig, load_config, save_config
 from tts.commands.configure import (
     configure_api_key,
     configure_voice,
     configure_output_dir,
     configure_format,
     configure_speed,
+    configure_set,
     _mask_key,
     _show_config,
     _reset_all,
+    _get_current_api_key,
 )
 
 
 class TestMaskKey:
     """Tests for _mask_key utility."""
 
-    def test_masks_long_key(self):
-        """Should mask middle of long keys."""
-        # GIVEN a long key
-        key = "abcd1234efgh5678"
-
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("abcd1234efgh5678", "abcd********5678"),
+            ("abc", "***"),
+            ("12345678", "********"),
+        ],
+        ids=["long", "short", "exactly-8"],
+    )
+    def test_masks_key(self, key, expected):
+        """Should show first and last 4 chars only for keys longer than 8."""
+        # GIVEN a key
         # WHEN masking
         result = _mask_key(key)
 
-        # THEN first 4 and last 4 should be visible
-        assert result == "abcd********5678"
+        # THEN only long keys keep their ends visible
+        assert result == expected
 
-    def test_masks_short_key(self):
-        """Should fully mask short keys."""
-        # GIVEN a short key
-        key = "abc"
 
-        # WHEN masking
-        result = _mask_key(key)
+class TestGetCurrentApiKey:
+    """Tests for _get_current_api_key lookup."""
 
-        # THEN should be all asterisks
-        assert result == "***"
+    def test_reads_key_from_credentials_file(
+        self, temp_config_dir, mock_keyring_unavailable
+    ):
+        """Should read the key from the credentials file, ignoring other lines."""
+        # GIVEN a credentials file with a comment before the key
+        creds_file = temp_config_dir / "credentials"
+        creds_file.write_text('# saved by tts\nFISH_API_KEY="file-key"\n')
 
-    def test_masks_exactly_8_chars(self):
-        """Should fully mask 8-char keys."""
-        # GIVEN an 8-char key
-        key = "12345678"
+        # WHEN the current key is looked up
+        key, source = _get_current_api_key()
 
-        # WHEN masking
-        result = _mask_key(key)
+        # THEN the quoted value should be returned from the file
+        assert key == "file-key"
+        assert "credentials file" in source
+
+    def test_sees_newly_saved_key(self, temp_config_dir, mock_keyring_unavailable):
+        """Saving a new key should be visible to the next lookup."""
+        # GIVEN no key is configured
+        assert _get_current_api_key()[0] is None
+
+        # WHEN a key is saved
+        configure_api_key("fresh-key")
 
-        # THEN should be all asterisks
-        assert result == "********"
+        # THEN the lookup should return the new key
+        assert _get_current_api_key()[0] == "fresh-key"
 
 
 class TestConfigureApiKey:
@@ -100,6 +119,22 @@ class TestConfigureApiKey:
         creds_file = temp_config_dir / "credentials"
         assert (creds_file.stat().st_mode & 0o777) == 0o600
 
+    def test_tightens_existing_file_permissions(
+        self, temp_config_dir, mock_keyring_unavailable
+    ):
+        """An existing world-readable credentials file should be locked down."""
+        # GIVEN a credentials file with loose permissions
+        creds_file = temp_config_dir / "credentials"
+        creds_file.write_text("FISH_API_KEY=old-key\n")
+        creds_file.chmod(0o644)
+
+        # WHEN configure is called
+        configure_api_key("new-key")
+
+        # THEN the file should hold the new key and be owner-only
+        assert creds_file.read_text() == "FISH_API_KEY=new-key\n"
+        assert (creds_file.stat().st_mode & 0o777) == 0o600
+
     def test_rejects_empty_key(self, temp_config_dir, capsys):
         """Should reject empty API key."""
         # GIVEN an empty API key
@@ -143,8 +178,6 @@ class TestConfigureVoice:
         configure_voice("voice-123")
 
         # THEN config file should have voice
-        from tts.config import load_config
-
         config = load_config()
         assert config.default_voice == "voice-123"
 
@@ -177,8 +210,6 @@ class TestConfigureOutputDir:
         configure_output_dir("/custom/path")
 
         # THEN config should be updated
-        from tts.config import load_config
-
         config = load_config()
         assert config.output_dir == "/custom/path"
 
@@ -200,8 +231,6 @@ class TestConfigureFormat:
         configure_format("wav")
 
         # THEN config should be updated
-        from tts.config import load_config
-
         config = load_config()
         assert config.format == "wav"
 
@@ -216,22 +245,59 @@ class TestConfigureSpeed:
         configure_speed(1.5)
 
         # THEN config should be updated
-        from tts.config import load_config
+        config = load_config()
+        assert config.speed == 1.5
+
+    @pytest.mark.parametrize("value", [0.4, 2.1], ids=["low", "high"])
+    def test_rejects_out_of_range_speed(self, temp_config_dir, capsys, value):
+        """Should reject speed outside 0.5-2.0."""
+        with pytest.raises(SystemExit) as exc_info:
+            configure_speed(value)
+
+        assert exc_info.value.code == 1
+
+
+class TestConfigureSet:
+    """Tests for configure_set command."""
 
+    def test_sets_several_values_with_one_write(self, temp_config_dir, mocker, capsys):
+        """Should apply all given settings in a single save."""
+        # GIVEN no existing config
+        save = mocker.spy(tts.config, "save_config")
+
+        # WHEN setting voice, format and speed together
+        configure_set(voice="voice-1", fmt="wav", speed=1.5)
+
+        # THEN all values should be stored
         config = load_config()
+        assert config.default_voice == "voice-1"
+        assert config.format == "wav"
         assert config.speed == 1.5
+        # AND the config file should be written once
+        assert save.call_count == 1
+        # AND each change should be confirmed like the single-setting commands
+        output = capsys.readouterr().out
+        assert "Default voice set to: voice-1" in output
+        assert "Default format set to: wav" in output
+        assert "Default speed set to: 1.5" in output
 
-    def test_rejects_low_speed(self, temp_config_dir, capsys):
-        """Should reject speed below 0.5."""
+    def test_invalid_value_leaves_config_untouched(self, temp_config_dir, capsys):
+        """Should reject the whole batch when one value is invalid."""
+        # GIVEN an existing config
+        save_config(TTSConfig(format="wav"))
+
+        # WHEN one of the values is out of range
         with pytest.raises(SystemExit) as exc_info:
-            configure_speed(0.4)
+            configure_set(voice="voice-1", speed=3.0)
 
+        # THEN nothing should be saved
         assert exc_info.value.code == 1
+        assert load_config() == TTSConfig(format="wav")
 
-    def test_rejects_high_speed(self, temp_config_dir, capsys):
-        """Should reject speed above 2.0."""
+    def test_rejects_no_changes(self, temp_config_dir, capsys):
+        """Should exit when no setting is given."""
         with pytest.raises(SystemExit) as exc_info:
-            configure_speed(2.1)
+            configure_set()
 
         assert exc_info.value.code == 1
 
@@ -242,8 +308,6 @@ class TestShowConfig:
     def test_shows_config(self, temp_config_dir, capsys, mock_keyring_unavailable):
         """Should display current configuration."""
         # GIVEN a config exists
-        from tts.config import save_config, TTSConfig
-
         save_config(TTSConfig(default_voice="test-voice", format="wav"))
 
         # WHEN showing config
@@ -261,8 +325,6 @@ class TestResetAll:
     def test_resets_config(self, temp_config_dir, mock_keyring_unavailable, capsys):
         """Should reset all configuration."""
         # GIVEN custom config and credentials
-        from tts.config import save_config, TTSConfig, load_config
-
         save_config(TTSConfig(format="wav"))
         creds_file = temp_config_dir / "credentials"
         creds_file.write_text("FISH_API_KEY=old-key\n")
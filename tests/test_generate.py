@@ -1,5 +1,8 @@
 """Tests for generate command."""
 
+import os
+import threading
+import time
 import pytest
 from pathlib import Path
 
@@ -28,6 +31,20 @@ class TestIsGlobPattern:
         assert _is_glob_pattern("/absolute/path.txt") is False
 
 
+@pytest.fixture(scope="session")
+def txt_tree(tmp_path_factory):
+    """Build one read-only tree of mixed files shared by the lookup tests."""
+    root = tmp_path_factory.mktemp("tts_tree")
+    for name in ("a.txt", "b.txt", "m.txt", "z.txt", "c.md", "d.py"):
+        (root / name).write_text(name)
+    (root / "sub").mkdir()
+    (root / "sub" / "nested.txt").write_text("nested")
+    (root / "scripts").mkdir()
+    (root / "scripts" / "script1.txt").write_text("1")
+    (root / "scripts" / "script2.txt").write_text("2")
+    return root
+
+
 class TestFindTextFiles:
     """Tests for find_text_files utility."""
 
@@ -43,34 +60,39 @@ class TestFindTextFiles:
         # THEN it should return the file in a list
         assert result == [txt_file]
 
-    def test_finds_txt_files_in_directory(self, tmp_path):
+    def test_single_file_skips_directory_scan(self, tmp_path, mocker):
+        """Should return a single .txt file without listing any directory."""
+        # GIVEN a single .txt file
+        txt_file = tmp_path / "speech.txt"
+        txt_file.write_text("content")
+        scandir = mocker.patch("os.scandir", side_effect=AssertionError)
+
+        # WHEN find_text_files is called with it
+        result = find_text_files(txt_file)
+
+        # THEN the file should be returned without a scan
+        assert result == [txt_file]
+        scandir.assert_not_called()
+
+    def test_finds_txt_files_in_directory(self, txt_tree):
         """Should find all .txt files in a directory."""
         # GIVEN a directory with mixed files
-        (tmp_path / "a.txt").write_text("a")
-        (tmp_path / "b.txt").write_text("b")
-        (tmp_path / "c.md").write_text("c")
-        (tmp_path / "d.py").write_text("d")
-
         # WHEN find_text_files is called
-        result = find_text_files(tmp_path)
+        result = find_text_files(txt_tree)
 
-        # THEN only .txt files should be returned
-        assert len(result) == 2
+        # THEN only its own .txt files should be returned
+        assert len(result) == 4
         assert all(f.suffix == ".txt" for f in result)
 
-    def test_returns_sorted_files(self, tmp_path):
+    def test_returns_sorted_files(self, txt_tree):
         """Should return files in sorted order."""
-        # GIVEN unsorted .txt files
-        (tmp_path / "z.txt").write_text("z")
-        (tmp_path / "a.txt").write_text("a")
-        (tmp_path / "m.txt").write_text("m")
-
+        # GIVEN .txt files created out of order
         # WHEN find_text_files is called
-        result = find_text_files(tmp_path)
+        result = find_text_files(txt_tree)
 
         # THEN files should be sorted
         names = [f.name for f in result]
-        assert names == ["a.txt", "m.txt", "z.txt"]
+        assert names == ["a.txt", "b.txt", "m.txt", "z.txt"]
 
     def test_rejects_non_txt_file(self, tmp_path):
         """Should exit when given a non-.txt file."""
@@ -93,57 +115,104 @@ class TestFindTextFiles:
         # THEN empty list should be returned
         assert result == []
 
-    def test_glob_pattern_asterisk(self, tmp_path, monkeypatch):
+    def test_does_not_stat_each_entry(self, tmp_path, mocker):
+        """Should classify directory entries without a stat per file."""
+        # GIVEN a directory with many files
+        for i in range(20):
+            (tmp_path / f"{i:02}.txt").write_text("x")
+            (tmp_path / f"{i:02}.md").write_text("x")
+        stat = mocker.spy(os, "stat")
+
+        # WHEN find_text_files is called
+        result = find_text_files(tmp_path)
+
+        # THEN all .txt files should be found
+        assert len(result) == 20
+        # AND only the directory itself should have been stat'ed, once
+        assert stat.call_count == 1
+
+    def test_exits_on_directory_read_error(self, tmp_path, mocker):
+        """Should exit when directory cannot be read."""
+        # GIVEN a directory that raises OSError
+        mocker.patch("os.scandir", side_effect=OSError("Permission denied"))
+
+        # WHEN find_text_files is called
+        with pytest.raises(SystemExit) as exc_info:
+            find_text_files(tmp_path)
+
+        # THEN should exit with error
+        assert exc_info.value.code == 1
+
+    def test_glob_pattern_asterisk(self, txt_tree, monkeypatch):
         """Should support *.txt glob pattern."""
-        # GIVEN multiple .txt files
-        (tmp_path / "a.txt").write_text("a")
-        (tmp_path / "b.txt").write_text("b")
-        (tmp_path / "c.md").write_text("c")
-        monkeypatch.chdir(tmp_path)
+        # GIVEN multiple .txt files next to other files
+        monkeypatch.chdir(txt_tree)
 
         # WHEN using glob pattern
         result = find_text_files("*.txt")
 
-        # THEN only .txt files should be returned
-        assert len(result) == 2
+        # THEN only top-level .txt files should be returned
         names = [f.name for f in result]
-        assert "a.txt" in names
-        assert "b.txt" in names
+        assert names == ["a.txt", "b.txt", "m.txt", "z.txt"]
 
-    def test_glob_pattern_recursive(self, tmp_path, monkeypatch):
+    def test_glob_pattern_recursive(self, txt_tree, monkeypatch):
         """Should support **/*.txt recursive glob pattern."""
         # GIVEN nested .txt files
-        (tmp_path / "root.txt").write_text("root")
-        subdir = tmp_path / "sub"
-        subdir.mkdir()
-        (subdir / "nested.txt").write_text("nested")
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.chdir(txt_tree)
 
         # WHEN using recursive glob pattern
         result = find_text_files("**/*.txt")
 
         # THEN all .txt files should be found
         names = [f.name for f in result]
+        assert "a.txt" in names
         assert "nested.txt" in names
+        assert "script1.txt" in names
 
-    def test_glob_pattern_subdir(self, tmp_path, monkeypatch):
+    def test_glob_pattern_subdir(self, txt_tree, monkeypatch):
         """Should support subdirectory glob pattern."""
-        # GIVEN files in subdirectory
-        subdir = tmp_path / "scripts"
-        subdir.mkdir()
-        (subdir / "script1.txt").write_text("1")
-        (subdir / "script2.txt").write_text("2")
-        (tmp_path / "other.txt").write_text("other")
-        monkeypatch.chdir(tmp_path)
+        # GIVEN files in a subdirectory and at the top level
+        monkeypatch.chdir(txt_tree)
 
         # WHEN using subdir glob pattern
         result = find_text_files("scripts/*.txt")
 
         # THEN only subdir files should be returned
-        assert len(result) == 2
         names = [f.name for f in result]
-        assert "script1.txt" in names
-        assert "other.txt" not in names
+        assert names == ["script1.txt", "script2.txt"]
+
+    def test_glob_pattern_without_suffix(self, txt_tree, monkeypatch):
+        """Should only return .txt files for a pattern ending in *."""
+        # GIVEN mixed files in nested directories
+        monkeypatch.chdir(txt_tree)
+
+        # WHEN using a recursive pattern without an extension
+        result = find_text_files("**/*")
+
+        # THEN only the .txt files should be returned
+        assert len(result) == 7
+        assert all(f.suffix == ".txt" for f in result)
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("notes.txt*", ["notes.txt"]),
+            ("chapter*", ["chapter1.md.txt", "chapter2.txt"]),
+        ],
+        ids=["extension-then-star", "name-then-star"],
+    )
+    def test_glob_pattern_trailing_star(self, tmp_path, monkeypatch, pattern, expected):
+        """Should keep matching .txt names that a trailing * already covers."""
+        # GIVEN .txt files whose names continue past the pattern's prefix
+        for name in ("notes.txt", "notes.txt.bak", "chapter1.md.txt", "chapter2.txt"):
+            (tmp_path / name).write_text("x")
+        monkeypatch.chdir(tmp_path)
+
+        # WHEN using a pattern ending in *
+        result = find_text_files(pattern)
+
+        # THEN the matching .txt files should be returned
+        assert [f.name for f in result] == expected
 
 
 class TestGenerate:
@@ -173,16 +242,14 @@ class TestGenerate:
         output = capsys.readouterr().out
         assert "FISH_API_KEY" in output
 
-    def test_requires_reference_id(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_requires_reference_id(
+        self, tmp_path, monkeypatch, capsys, mock_fish_client
+    ):
         """Generate should fail without reference_id."""
         # GIVEN a text file and API key but no reference_id
         text_file = tmp_path / "test.txt"
         text_file.write_text("Hello world")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # AND no default voice configured
         config_file = tmp_path / "config.toml"
         monkeypatch.setattr("tts.config.CONFIG_FILE", config_file)
@@ -196,20 +263,13 @@ class TestGenerate:
         output = capsys.readouterr().out
         assert "reference-id" in output.lower()
 
-    def test_processes_single_file(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_processes_single_file(self, tmp_path, capsys, mock_fish_client):
         """Generate should process a single text file."""
         # GIVEN a text file and API key
         text_file = tmp_path / "hello.txt"
         text_file.write_text("Hello, this is a test.")
         output_dir = tmp_path / "output"
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-
-        # AND Fish client is mocked
-        mock_client = mocker.MagicMock()
-        mock_client.tts.convert.return_value = b"fake-audio-data"
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # WHEN generate is called
         generate(
             str(text_file),
@@ -218,23 +278,19 @@ class TestGenerate:
         )
 
         # THEN API should be called correctly
-        mock_client.tts.convert.assert_called_once()
-        call_kwargs = mock_client.tts.convert.call_args[1]
+        mock_fish_client.tts.convert.assert_called_once()
+        call_kwargs = mock_fish_client.tts.convert.call_args[1]
         assert call_kwargs["text"] == "Hello, this is a test."
         assert call_kwargs["reference_id"] == "voice-123"
         # AND output file should be created
         assert (output_dir / "hello.mp3").exists()
 
-    def test_skips_empty_files(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_skips_empty_files(self, tmp_path, capsys, mock_fish_client):
         """Generate should skip empty text files."""
         # GIVEN an empty file
         text_file = tmp_path / "empty.txt"
         text_file.write_text("")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # WHEN generate is called
         generate(
             str(text_file),
@@ -243,21 +299,17 @@ class TestGenerate:
         )
 
         # THEN API should not be called
-        mock_client.tts.convert.assert_not_called()
+        mock_fish_client.tts.convert.assert_not_called()
         # AND skip message should be shown
         output = capsys.readouterr().out
         assert "Skipping" in output
 
-    def test_rejects_invalid_speed(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_rejects_invalid_speed(self, tmp_path, capsys, mock_fish_client):
         """Generate should reject speed outside valid range."""
         # GIVEN a text file
         text_file = tmp_path / "test.txt"
         text_file.write_text("content")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # WHEN generate is called with invalid speed
         # THEN it should exit with error
         with pytest.raises(SystemExit) as exc_info:
@@ -271,12 +323,103 @@ class TestGenerate:
         output = capsys.readouterr().out
         assert "speed" in output.lower()
 
-    def test_exits_on_no_txt_files(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_validates_before_creating_client(self, tmp_path, mocker):
+        """Invalid arguments should fail before the Fish client is created."""
+        # GIVEN a text file and a client factory that should not be reached
+        text_file = tmp_path / "test.txt"
+        text_file.write_text("content")
+        get_client = mocker.patch("tts.commands.generate.get_fish_client")
+
+        # WHEN generate is called with an invalid speed
+        with pytest.raises(SystemExit):
+            generate(str(text_file), reference_id="voice-123", speed=3.0)
+
+        # THEN the client should never be created
+        get_client.assert_not_called()
+
+    def test_rejects_invalid_concurrency(self, tmp_path, capsys):
+        """Generate should reject a concurrency below 1."""
+        # GIVEN a text file
+        text_file = tmp_path / "test.txt"
+        text_file.write_text("content")
+
+        # WHEN generate is called with zero concurrency
+        # THEN it should exit with error
+        with pytest.raises(SystemExit) as exc_info:
+            generate(str(text_file), reference_id="voice-123", concurrency=0)
+
+        assert exc_info.value.code == 1
+        output = capsys.readouterr().out
+        assert "concurrency" in output.lower()
+
+    def test_processes_files_concurrently_in_order(
+        self, tmp_path, capsys, mock_fish_client
+    ):
+        """Generate should convert all files and report them in input order."""
+        # GIVEN several text files
+        for name in ["c", "a", "b"]:
+            (tmp_path / f"{name}.txt").write_text(f"text {name}")
+        output_dir = tmp_path / "output"
+
+        # WHEN generate is called with several workers
+        generate(
+            str(tmp_path),
+            reference_id="voice-123",
+            output_dir=output_dir,
+            concurrency=3,
+        )
+
+        # THEN every file should be converted
+        assert mock_fish_client.tts.convert.call_count == 3
+        names = sorted(p.name for p in output_dir.iterdir())
+        assert names == ["a.mp3", "b.mp3", "c.mp3"]
+        # AND the report should follow the sorted input order
+        output = capsys.readouterr().out
+        assert output.index("a.txt") < output.index("b.txt") < output.index("c.txt")
+
+    def test_same_output_name_converted_in_order(
+        self, tmp_path, monkeypatch, mock_fish_client
+    ):
+        """Files mapping to the same output should not be written concurrently."""
+        # GIVEN text files with the same name in different directories
+        for folder in ("a", "b"):
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / "intro.txt").write_text(f"intro {folder}")
+        output_dir = tmp_path / "output"
+        monkeypatch.chdir(tmp_path)
+
+        # AND a conversion that notices overlapping calls
+        active = threading.Lock()
+        overlapped = []
+
+        def convert_mock(*, text, **kwargs):
+            if not active.acquire(blocking=False):
+                overlapped.append(text)
+                return text.encode()
+            try:
+                time.sleep(0.05)
+                return text.encode()
+            finally:
+                active.release()
+
+        mock_fish_client.tts.convert.side_effect = convert_mock
+
+        # WHEN generate is called on a recursive glob with several workers
+        generate(
+            "**/*.txt",
+            reference_id="voice-123",
+            output_dir=output_dir,
+            concurrency=4,
+        )
+
+        # THEN the two conversions should not have overlapped
+        assert overlapped == []
+        # AND the later file should win, as with sequential processing
+        assert (output_dir / "intro.mp3").read_bytes() == b"intro b"
+
+    def test_exits_on_no_txt_files(self, tmp_path, capsys, mock_fish_client):
         """Generate should exit when no .txt files found."""
         # GIVEN an empty directory
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mocker.patch("fishaudio.FishAudio")
-
         # WHEN generate is called
         # THEN it should exit
         with pytest.raises(SystemExit) as exc_info:
@@ -289,18 +432,13 @@ class TestGenerate:
         output = capsys.readouterr().out
         assert "No .txt files" in output
 
-    def test_creates_output_directory(self, tmp_path, monkeypatch, mocker):
+    def test_creates_output_directory(self, tmp_path, mock_fish_client):
         """Generate should create output directory if missing."""
         # GIVEN a text file and non-existent output dir
         text_file = tmp_path / "test.txt"
         text_file.write_text("content")
         output_dir = tmp_path / "nested" / "output"
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.tts.convert.return_value = b"audio"
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # WHEN generate is called
         generate(
             str(text_file),
@@ -311,18 +449,13 @@ class TestGenerate:
         # THEN output directory should be created
         assert output_dir.exists()
 
-    def test_uses_specified_format(self, tmp_path, monkeypatch, mocker):
+    def test_uses_specified_format(self, tmp_path, mock_fish_client):
         """Generate should use the specified output format."""
         # GIVEN a text file
         text_file = tmp_path / "test.txt"
         text_file.write_text("content")
         output_dir = tmp_path / "output"
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.tts.convert.return_value = b"audio"
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # WHEN generate is called with wav format
         generate(
             str(text_file),
@@ -334,20 +467,15 @@ class TestGenerate:
         # THEN output should have .wav extension
         assert (output_dir / "test.wav").exists()
         # AND API should be called with wav format
-        call_kwargs = mock_client.tts.convert.call_args[1]
+        call_kwargs = mock_fish_client.tts.convert.call_args[1]
         assert call_kwargs["format"] == "wav"
 
-    def test_uses_config_defaults(self, tmp_path, monkeypatch, mocker):
+    def test_uses_config_defaults(self, tmp_path, monkeypatch, mock_fish_client):
         """Generate should use config defaults when options not specified."""
         # GIVEN a text file
         text_file = tmp_path / "test.txt"
         text_file.write_text("content")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.tts.convert.return_value = b"audio"
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # AND config has custom defaults
         config_dir = tmp_path / ".config" / "tts"
         config_dir.mkdir(parents=True)
@@ -369,23 +497,18 @@ speed = 1.5
         generate(str(text_file))
 
         # THEN config defaults should be used
-        call_kwargs = mock_client.tts.convert.call_args[1]
+        call_kwargs = mock_fish_client.tts.convert.call_args[1]
         assert call_kwargs["reference_id"] == "config-voice"
         assert call_kwargs["format"] == "wav"
         assert call_kwargs["speed"] == 1.5
 
-    def test_cli_options_override_config(self, tmp_path, monkeypatch, mocker):
+    def test_cli_options_override_config(self, tmp_path, monkeypatch, mock_fish_client):
         """CLI options should override config defaults."""
         # GIVEN a text file
         text_file = tmp_path / "test.txt"
         text_file.write_text("content")
         output_dir = tmp_path / "cli_output"
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.tts.convert.return_value = b"audio"
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
-
         # AND config has defaults
         config_dir = tmp_path / ".config" / "tts"
         config_dir.mkdir(parents=True)
@@ -407,7 +530,7 @@ speed = 1.5
         )
 
         # THEN CLI options should be used
-        call_kwargs = mock_client.tts.convert.call_args[1]
+        call_kwargs = mock_fish_client.tts.convert.call_args[1]
         assert call_kwargs["reference_id"] == "cli-voice"
         assert call_kwargs["format"] == "pcm"
         assert call_kwargs["speed"] == 0.8
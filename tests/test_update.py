@@ -1,6 +1,10 @@
 """Tests for update command."""
 
+import hashlib
+import json
+import time
 from pathlib import Path
+import httpx
 import pytest
 
 from tts.commands.update import (
@@ -16,6 +20,29 @@ from tts.commands.update import (
 )
 
 
+@pytest.fixture(autouse=True)
+def release_cache(tmp_path, monkeypatch):
+    """Keep the release response cache out of the real config directory."""
+    cache_file = tmp_path / "update_cache.json"
+    monkeypatch.setattr("tts.commands.update.RELEASE_CACHE_FILE", cache_file)
+    return cache_file
+
+
+def mock_http_client(mocker, handler):
+    """Route update HTTP calls through an in-process httpx transport."""
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return mocker.patch("tts.commands.update.get_http_client", return_value=client)
+
+
+def raise_network_error(message):
+    """Build a transport handler that fails every request."""
+
+    def handler(request):
+        raise httpx.ConnectError(message, request=request)
+
+    return handler
+
+
 class TestGetPlatformBinary:
     """Tests for platform binary name detection."""
 
@@ -67,6 +94,20 @@ class TestGetPlatformBinary:
         # THEN Windows binary with .exe should be returned
         assert result == "tts-windows-x64.exe"
 
+    def test_detects_platform_once(self, mocker):
+        """Should reuse the detected binary name on later calls."""
+        # GIVEN a Linux platform
+        system = mocker.patch("platform.system", return_value="Linux")
+        mocker.patch("platform.machine", return_value="x86_64")
+
+        # WHEN get_platform_binary is called twice
+        first = get_platform_binary()
+        second = get_platform_binary()
+
+        # THEN the platform should only be queried once
+        assert first == second == "tts-linux-x64"
+        system.assert_called_once()
+
 
 class TestParseVersion:
     """Tests for version parsing."""
@@ -108,6 +149,19 @@ class TestParseVersion:
         assert v1 < v2
         assert v2 > v1
 
+    def test_reuses_parsed_result(self):
+        """Repeated calls with the same string should hit the cache."""
+        # GIVEN a version that was parsed once
+        first = parse_version("2025.02.14")
+        hits = parse_version.cache_info().hits
+
+        # WHEN it is parsed again
+        second = parse_version("2025.02.14")
+
+        # THEN the cached tuple should be returned
+        assert second is first
+        assert parse_version.cache_info().hits == hits + 1
+
 
 class TestFetchLatestRelease:
     """Tests for GitHub API fetch."""
@@ -115,10 +169,7 @@ class TestFetchLatestRelease:
     def test_returns_none_on_network_error(self, mocker):
         """Should return None when network fails."""
         # GIVEN network is unavailable
-        mocker.patch(
-            "urllib.request.urlopen",
-            side_effect=Exception("Network error"),
-        )
+        mock_http_client(mocker, raise_network_error("Network error"))
 
         # WHEN fetch_latest_release is called
         result = fetch_latest_release()
@@ -129,11 +180,10 @@ class TestFetchLatestRelease:
     def test_returns_release_data(self, mocker):
         """Should return release data on success."""
         # GIVEN API returns release data
-        mock_response = mocker.MagicMock()
-        mock_response.read.return_value = b'{"tag_name": "v2025.01.30"}'
-        mock_response.__enter__ = mocker.MagicMock(return_value=mock_response)
-        mock_response.__exit__ = mocker.MagicMock(return_value=False)
-        mocker.patch("urllib.request.urlopen", return_value=mock_response)
+        mock_http_client(
+            mocker,
+            lambda request: httpx.Response(200, json={"tag_name": "v2025.01.30"}),
+        )
 
         # WHEN fetch_latest_release is called
         result = fetch_latest_release()
@@ -141,6 +191,190 @@ class TestFetchLatestRelease:
         # THEN release data should be returned
         assert result == {"tag_name": "v2025.01.30"}
 
+    def test_retries_transient_server_errors(self, mocker):
+        """Should retry 5xx responses before giving up."""
+        # GIVEN an API that fails twice, then succeeds
+        responses = iter(
+            [
+                httpx.Response(503),
+                httpx.Response(502),
+                httpx.Response(200, json={"tag_name": "v2025.01.30"}),
+            ]
+        )
+        mock_http_client(mocker, lambda request: next(responses))
+        sleep = mocker.patch("time.sleep")
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN the eventual success should be returned after backing off
+        assert result == {"tag_name": "v2025.01.30"}
+        assert sleep.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("retry_after", "expected_sleep"),
+        [("2", 2), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.5), ("soon", 0.5)],
+        ids=["seconds", "past-http-date", "invalid"],
+    )
+    def test_honors_retry_after(self, mocker, retry_after, expected_sleep):
+        """Should wait for a short Retry-After and fall back to backoff otherwise."""
+        # GIVEN a rate-limited response, then success
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": retry_after}),
+                httpx.Response(200, json={"tag_name": "v2025.01.30"}),
+            ]
+        )
+        mock_http_client(mocker, lambda request: next(responses))
+        sleep = mocker.patch("time.sleep")
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN it should have slept for the expected delay before succeeding
+        assert result == {"tag_name": "v2025.01.30"}
+        sleep.assert_called_once_with(expected_sleep)
+
+    def test_gives_up_on_long_retry_after(self, mocker):
+        """Should not sleep when the server asks to wait longer than the cap."""
+        # GIVEN a rate-limited response asking for an hour's wait
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429, headers={"Retry-After": "3600"})
+
+        mock_http_client(mocker, handler)
+        sleep = mocker.patch("time.sleep")
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN it should report failure right away without sleeping
+        assert result is None
+        sleep.assert_not_called()
+        assert len(requests) == 1
+
+    def test_returns_none_after_retries_exhausted(self, mocker):
+        """Should return None when the API keeps failing."""
+        # GIVEN an API that always answers 500
+        mock_http_client(mocker, lambda request: httpx.Response(500))
+        mocker.patch("time.sleep")
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN None should be returned
+        assert result is None
+
+    def test_returns_fresh_cache_without_request(self, mocker, release_cache):
+        """Should serve a recent cached response without hitting the network."""
+        # GIVEN a cache written moments ago
+        release_cache.write_text(
+            json.dumps(
+                {"fetched_at": time.time(), "etag": None, "release": {"tag_name": "v1"}}
+            )
+        )
+        client = mock_http_client(mocker, raise_network_error("Network error"))
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN the cached release should be returned
+        assert result == {"tag_name": "v1"}
+        client.assert_not_called()
+
+    def test_revalidates_stale_cache_with_etag(self, mocker, release_cache):
+        """Should send If-None-Match and reuse the cache on 304."""
+        # GIVEN a stale cache with an ETag
+        release_cache.write_text(
+            json.dumps(
+                {"fetched_at": 0, "etag": '"abc"', "release": {"tag_name": "v1"}}
+            )
+        )
+        seen = {}
+
+        def handler(request):
+            seen["etag"] = request.headers.get("If-None-Match")
+            return httpx.Response(304)
+
+        mock_http_client(mocker, handler)
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN the conditional request should reuse the cached release
+        assert seen["etag"] == '"abc"'
+        assert result == {"tag_name": "v1"}
+        # AND the cache should be fresh again
+        assert json.loads(release_cache.read_text())["fetched_at"] > 0
+
+    def test_revalidates_with_last_modified(self, mocker, release_cache):
+        """Should send If-Modified-Since when the cache has Last-Modified."""
+        # GIVEN a stale cache with only a Last-Modified validator
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        release_cache.write_text(
+            json.dumps(
+                {
+                    "fetched_at": 0,
+                    "etag": None,
+                    "last_modified": last_modified,
+                    "release": {"tag_name": "v1"},
+                }
+            )
+        )
+        seen = {}
+
+        def handler(request):
+            seen["since"] = request.headers.get("If-Modified-Since")
+            return httpx.Response(304)
+
+        mock_http_client(mocker, handler)
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN the conditional request should reuse the cached release
+        assert seen["since"] == last_modified
+        assert result == {"tag_name": "v1"}
+        # AND the validator should be kept for next time
+        cached = json.loads(release_cache.read_text())
+        assert cached["last_modified"] == last_modified
+
+    def test_ignores_corrupt_cache(self, mocker, release_cache):
+        """Should drop an unreadable cache and fetch live data."""
+        # GIVEN a corrupt cache file
+        release_cache.write_text("{not json")
+        mock_http_client(
+            mocker,
+            lambda request: httpx.Response(
+                200, json={"tag_name": "v2"}, headers={"ETag": '"new"'}
+            ),
+        )
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN live data should be returned and cached
+        assert result == {"tag_name": "v2"}
+        cached = json.loads(release_cache.read_text())
+        assert cached["etag"] == '"new"'
+        assert cached["release"] == {"tag_name": "v2"}
+
+    def test_treats_unremovable_cache_as_miss(self, mocker, release_cache):
+        """Should fetch live data when the cache path can't be read or removed."""
+        # GIVEN a directory where the cache file should be
+        release_cache.mkdir()
+        mock_http_client(
+            mocker, lambda request: httpx.Response(200, json={"tag_name": "v2"})
+        )
+
+        # WHEN fetch_latest_release is called
+        result = fetch_latest_release()
+
+        # THEN live data should be returned without raising
+        assert result == {"tag_name": "v2"}
+
 
 class TestUpdate:
     """Tests for update command."""
@@ -269,11 +503,7 @@ class TestFetchChecksums:
         """Should parse checksums.txt format."""
         # GIVEN checksums file content
         content = b"abc123  tts-linux-x64\ndef456  tts-macos-arm64"
-        mock_response = mocker.MagicMock()
-        mock_response.read.return_value = content
-        mock_response.__enter__ = mocker.MagicMock(return_value=mock_response)
-        mock_response.__exit__ = mocker.MagicMock(return_value=False)
-        mocker.patch("urllib.request.urlopen", return_value=mock_response)
+        mock_http_client(mocker, lambda request: httpx.Response(200, content=content))
 
         # WHEN fetch_checksums is called
         result = fetch_checksums("v2025.01.01")
@@ -284,10 +514,24 @@ class TestFetchChecksums:
             "tts-macos-arm64": "def456",
         }
 
+    @pytest.mark.parametrize("count", [1, 10, 100])
+    def test_parses_many_entries(self, mocker, count):
+        """Should parse every entry, skipping blank and malformed lines."""
+        # GIVEN a checksums file with the given number of entries
+        lines = [f"{i:064x}  tts-file-{i}" for i in range(count)]
+        content = "\n".join(lines + ["", "not-a-checksum-line"]).encode() + b"\n"
+        mock_http_client(mocker, lambda request: httpx.Response(200, content=content))
+
+        # WHEN fetch_checksums is called
+        result = fetch_checksums("v2025.01.01")
+
+        # THEN each filename should map to its hash
+        assert result == {f"tts-file-{i}": f"{i:064x}" for i in range(count)}
+
     def test_returns_empty_on_network_error(self, mocker):
         """Should return empty dict on network error."""
         # GIVEN network error
-        mocker.patch("urllib.request.urlopen", side_effect=Exception("Network error"))
+        mock_http_client(mocker, raise_network_error("Network error"))
 
         # WHEN fetch_checksums is called
         result = fetch_checksums("v2025.01.01")
@@ -333,12 +577,7 @@ class TestDownloadFile:
         """Should download file content to destination path."""
         # GIVEN a URL that returns content
         content = b"binary content here"
-        mock_response = mocker.MagicMock()
-        mock_response.headers = {"Content-Length": str(len(content))}
-        mock_response.read.side_effect = [content, b""]
-        mock_response.__enter__ = mocker.MagicMock(return_value=mock_response)
-        mock_response.__exit__ = mocker.MagicMock(return_value=False)
-        mocker.patch("urllib.request.urlopen", return_value=mock_response)
+        mock_http_client(mocker, lambda request: httpx.Response(200, content=content))
 
         dest = tmp_path / "downloaded.bin"
 
@@ -349,12 +588,69 @@ class TestDownloadFile:
         assert dest.exists()
         assert dest.read_bytes() == content
 
+    def test_hashes_while_downloading(self, tmp_path, mocker):
+        """Should feed every downloaded chunk to the given hasher."""
+        # GIVEN a URL that returns content
+        content = b"binary content here"
+        mock_http_client(mocker, lambda request: httpx.Response(200, content=content))
+        hasher = hashlib.sha256()
+
+        # WHEN download_file is called with a hasher
+        download_file(
+            "https://example.com/file.bin",
+            tmp_path / "downloaded.bin",
+            show_progress=False,
+            hasher=hasher,
+        )
+
+        # THEN the digest should match the content
+        assert hasher.digest() == hashlib.sha256(content).digest()
+
+    def test_trims_preallocated_space(self, tmp_path, mocker):
+        """Should leave only the received bytes when Content-Length overstates."""
+        # GIVEN a response whose Content-Length exceeds the decoded body
+        content = b"short body"
+        mock_http_client(
+            mocker,
+            lambda request: httpx.Response(
+                200, headers={"Content-Length": "4096"}, content=iter([content])
+            ),
+        )
+        dest = tmp_path / "downloaded.bin"
+
+        # WHEN download_file is called
+        download_file("https://example.com/file.bin", dest, show_progress=False)
+
+        # THEN the file should hold exactly the body
+        assert dest.read_bytes() == content
+
+    def test_throttles_progress_redraws(self, tmp_path, mocker, capsys):
+        """Should redraw the progress bar once per percent at most."""
+        # GIVEN a response delivered in many small chunks
+        chunks = [b"x"] * 1000
+        mock_http_client(
+            mocker,
+            lambda request: httpx.Response(
+                200,
+                headers={"Content-Length": str(len(chunks))},
+                content=iter(chunks),
+            ),
+        )
+        mocker.patch("tts.commands.update.DOWNLOAD_CHUNK_SIZE", 1)
+
+        # WHEN download_file is called with progress
+        download_file("https://example.com/file.bin", tmp_path / "out.bin")
+
+        # THEN far fewer redraws than chunks should be printed
+        output = capsys.readouterr().out
+        assert output.count("\r") <= 101
+        # AND the final state should be shown
+        assert "100%" in output
+
     def test_raises_on_network_error(self, tmp_path, mocker):
         """Should raise exception on network error."""
         # GIVEN network error
-        mocker.patch(
-            "urllib.request.urlopen", side_effect=Exception("Connection refused")
-        )
+        mock_http_client(mocker, raise_network_error("Connection refused"))
 
         dest = tmp_path / "downloaded.bin"
 
@@ -507,11 +803,11 @@ class TestUpdateAdvanced:
         )
 
         # Download writes a file that won't match checksum
-        def fake_download(url, dest, show_progress=True):
+        def fake_download(url, dest, show_progress=True, hasher=None):
             dest.write_bytes(b"downloaded content")
+            hasher.update(b"downloaded content")
 
         mocker.patch("tts.commands.update.download_file", side_effect=fake_download)
-        mocker.patch("tts.commands.update.verify_checksum", return_value=False)
 
         # WHEN update is called with force
         with pytest.raises(SystemExit) as exc_info:
@@ -537,14 +833,16 @@ class TestUpdateAdvanced:
         mocker.patch("platform.machine", return_value="x86_64")
         mocker.patch(
             "tts.commands.update.fetch_checksums",
-            return_value={"tts-linux-x64": "abc123"},
+            return_value={
+                "tts-linux-x64": hashlib.sha256(b"new binary content").hexdigest()
+            },
         )
 
-        def fake_download(url, dest, show_progress=True):
+        def fake_download(url, dest, show_progress=True, hasher=None):
             dest.write_bytes(b"new binary content")
+            hasher.update(b"new binary content")
 
         mocker.patch("tts.commands.update.download_file", side_effect=fake_download)
-        mocker.patch("tts.commands.update.verify_checksum", return_value=True)
         mocker.patch("shutil.move")
 
         # WHEN update is called with force
@@ -1,13 +1,17 @@
 """Tests for voice management commands."""
 
+import threading
+from pathlib import Path
+
 import pytest
 
 from tts.commands.voice import (
+    convert_to_wav,
     find_audio_files,
+    list_models,
     read_transcript,
-    convert_to_wav,
+    scan_samples,
     upload,
-    list_models,
 )
 
 
@@ -69,7 +73,7 @@ class TestFindAudioFiles:
     def test_exits_on_directory_read_error(self, tmp_path, mocker):
         """Should exit when directory cannot be read."""
         # GIVEN a directory that raises OSError
-        mocker.patch("pathlib.Path.iterdir", side_effect=OSError("Permission denied"))
+        mocker.patch("os.scandir", side_effect=OSError("Permission denied"))
 
         # WHEN find_audio_files is called
         with pytest.raises(SystemExit) as exc_info:
@@ -87,14 +91,13 @@ class TestConvertToWav:
         # GIVEN an audio file and ffmpeg succeeds
         audio_file = tmp_path / "audio.mp3"
         audio_file.write_bytes(b"fake mp3")
-        wav_content = b"RIFF....WAVEfmt "
+        dest = tmp_path / "audio.wav"
 
         mock_run = mocker.patch("subprocess.run")
         mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = wav_content
 
         # WHEN convert_to_wav is called
-        result = convert_to_wav(audio_file)
+        result = convert_to_wav(audio_file, dest)
 
         # THEN ffmpeg should be called with correct args
         mock_run.assert_called_once()
@@ -102,8 +105,28 @@ class TestConvertToWav:
         assert call_args[0] == "ffmpeg"
         assert "-f" in call_args
         assert "wav" in call_args
-        # AND WAV content should be returned
-        assert result == wav_content
+        # AND it should ignore embedded cover art
+        assert "-vn" in call_args
+        # AND it should write to the destination file rather than a pipe
+        assert call_args[-1] == str(dest)
+        assert result == dest
+
+    def test_resamples_when_requested(self, tmp_path, mocker):
+        """Should pass the sample rate and mono downmix to ffmpeg."""
+        # GIVEN an audio file and ffmpeg succeeds
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b"fake mp3")
+
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value.returncode = 0
+
+        # WHEN convert_to_wav is called with a sample rate and mono
+        convert_to_wav(audio_file, tmp_path / "audio.wav", sample_rate=22050, mono=True)
+
+        # THEN ffmpeg should resample and downmix
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index("-ar") + 1] == "22050"
+        assert call_args[call_args.index("-ac") + 1] == "1"
 
     def test_raises_on_ffmpeg_error(self, tmp_path, mocker):
         """Should raise RuntimeError when ffmpeg fails."""
@@ -118,7 +141,42 @@ class TestConvertToWav:
         # WHEN convert_to_wav is called
         # THEN RuntimeError should be raised with last line of stderr
         with pytest.raises(RuntimeError, match="Conversion failed"):
-            convert_to_wav(audio_file)
+            convert_to_wav(audio_file, tmp_path / "audio.wav")
+
+    def test_raises_on_silent_ffmpeg_error(self, tmp_path, mocker):
+        """Should raise RuntimeError with the exit code when stderr is empty."""
+        # GIVEN ffmpeg fails without writing to stderr
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b"fake mp3")
+
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value.returncode = 69
+        mock_run.return_value.stderr = b""
+
+        # WHEN convert_to_wav is called
+        # THEN RuntimeError should mention the exit code
+        with pytest.raises(RuntimeError, match="exited with 69"):
+            convert_to_wav(audio_file, tmp_path / "audio.wav")
+
+
+class TestScanSamples:
+    """Tests for scan_samples utility."""
+
+    def test_indexes_transcripts_by_stem(self, tmp_path):
+        """Should return audio files and a stem-to-path map of .txt files."""
+        # GIVEN audio files, a transcript, and unrelated files
+        (tmp_path / "b.mp3").write_bytes(b"audio")
+        (tmp_path / "a.wav").write_bytes(b"audio")
+        (tmp_path / "a.txt").write_text("hello")
+        (tmp_path / "notes.md").write_text("ignore")
+
+        # WHEN scan_samples is called
+        audio_files, txt_index = scan_samples(tmp_path)
+
+        # THEN audio files should be sorted
+        assert [f.name for f in audio_files] == ["a.wav", "b.mp3"]
+        # AND only transcripts should be indexed
+        assert txt_index == {"a": tmp_path / "a.txt"}
 
 
 class TestReadTranscript:
@@ -137,6 +195,21 @@ class TestReadTranscript:
         # THEN transcript content should be returned
         assert result == "This is the transcript."
 
+    def test_uses_transcript_index(self, tmp_path):
+        """Should resolve transcripts through the index when given one."""
+        # GIVEN a transcript that exists but is missing from the index
+        audio_path = tmp_path / "sample.wav"
+        (tmp_path / "sample.txt").write_text("This is the transcript.")
+
+        # WHEN read_transcript is called with an empty index
+        result = read_transcript(audio_path, {})
+
+        # THEN the index should be trusted and None returned
+        assert result is None
+        # AND an indexed transcript should be read
+        index = {"sample": tmp_path / "sample.txt"}
+        assert read_transcript(audio_path, index) == "This is the transcript."
+
     def test_returns_none_if_no_transcript(self, tmp_path):
         """Should return None if no companion .txt file."""
         # GIVEN audio file without transcript
@@ -200,15 +273,12 @@ class TestUpload:
         output = capsys.readouterr().out
         assert "FISH_API_KEY" in output
 
-    def test_rejects_non_directory(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_rejects_non_directory(self, tmp_path, capsys, mock_fish_client):
         """Upload should fail for non-directory path."""
         # GIVEN a file path instead of directory
         file_path = tmp_path / "file.txt"
         file_path.write_text("content")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mocker.patch("fishaudio.FishAudio")
-
         # WHEN upload is called with file path
         with pytest.raises(SystemExit) as exc_info:
             upload(file_path, title="Test")
@@ -218,12 +288,9 @@ class TestUpload:
         output = capsys.readouterr().out
         assert "not a directory" in output
 
-    def test_exits_on_no_audio_files(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_exits_on_no_audio_files(self, tmp_path, capsys, mock_fish_client):
         """Upload should exit when no audio files found."""
         # GIVEN empty directory
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mocker.patch("fishaudio.FishAudio")
-
         # WHEN upload is called
         with pytest.raises(SystemExit) as exc_info:
             upload(tmp_path, title="Test")
@@ -233,7 +300,7 @@ class TestUpload:
         output = capsys.readouterr().out
         assert "No audio files" in output
 
-    def test_uploads_with_transcripts(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_uploads_with_transcripts(self, tmp_path, mocker, capsys, mock_fish_client):
         """Upload should include transcripts when all files have them."""
         # GIVEN audio files with transcripts
         (tmp_path / "a.wav").write_bytes(b"audio1")
@@ -241,20 +308,19 @@ class TestUpload:
         (tmp_path / "b.wav").write_bytes(b"audio2")
         (tmp_path / "b.txt").write_text("Transcript two")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
 
         # WHEN upload is called
         upload(tmp_path, title="Test Voice")
 
         # THEN voices.create should be called with texts
-        call_kwargs = mock_client.voices.create.call_args[1]
+        call_kwargs = mock_fish_client.voices.create.call_args[1]
         assert "texts" in call_kwargs
         assert len(call_kwargs["texts"]) == 2
 
-    def test_ignores_partial_transcripts(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_ignores_partial_transcripts(
+        self, tmp_path, mocker, capsys, mock_fish_client
+    ):
         """Upload should ignore transcripts when only some files have them."""
         # GIVEN some audio files have transcripts
         (tmp_path / "a.wav").write_bytes(b"audio1")
@@ -262,10 +328,7 @@ class TestUpload:
         (tmp_path / "b.wav").write_bytes(b"audio2")
         # b.txt is missing
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
 
         # WHEN upload is called
         upload(tmp_path, title="Test Voice")
@@ -274,18 +337,19 @@ class TestUpload:
         output = capsys.readouterr().out
         assert "some files have transcripts" in output.lower()
         # AND texts should not be passed
-        call_kwargs = mock_client.voices.create.call_args[1]
+        call_kwargs = mock_fish_client.voices.create.call_args[1]
         assert "texts" not in call_kwargs
 
-    def test_prints_voice_id_on_success(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_prints_voice_id_on_success(
+        self, tmp_path, mocker, capsys, mock_fish_client
+    ):
         """Upload should print voice ID on success."""
         # GIVEN audio file
         (tmp_path / "sample.wav").write_bytes(b"audio")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.voices.create.return_value = mocker.MagicMock(id="voice-abc123")
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(
+            id="voice-abc123"
+        )
 
         # WHEN upload is called
         upload(tmp_path, title="Test Voice")
@@ -294,6 +358,93 @@ class TestUpload:
         output = capsys.readouterr().out
         assert "voice-abc123" in output
 
+    def test_streams_wav_samples_from_disk(self, tmp_path, mocker, mock_fish_client):
+        """Upload should pass WAV samples as open files instead of bytes."""
+        # GIVEN a WAV sample
+        sample = tmp_path / "sample.wav"
+        sample.write_bytes(b"audio")
+
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
+
+        # WHEN upload is called
+        upload(tmp_path, title="Test Voice")
+
+        # THEN the sample should be handed over as a file object
+        (voice_file,) = mock_fish_client.voices.create.call_args[1]["voices"]
+        assert voice_file.name == str(sample)
+        # AND it should be closed once the upload finishes
+        assert voice_file.closed
+
+    def test_streams_converted_samples_from_temp_files(
+        self, tmp_path, mocker, mock_fish_client
+    ):
+        """Upload should stream converted samples from temp files it cleans up."""
+        # GIVEN a sample that needs conversion
+        (tmp_path / "sample.mp3").write_bytes(b"audio")
+
+        def convert_mock(path, dest, **kwargs):
+            dest.write_bytes(b"wav content")
+            return dest
+
+        mocker.patch("tts.commands.voice.convert_to_wav", side_effect=convert_mock)
+
+        # AND the upload reads the sample it is given
+        uploaded = []
+
+        def create_mock(**kwargs):
+            uploaded.extend((Path(f.name), f.read()) for f in kwargs["voices"])
+            return mocker.MagicMock(id="voice-123")
+
+        mock_fish_client.voices.create.side_effect = create_mock
+
+        # WHEN upload is called
+        upload(tmp_path, title="Test Voice")
+
+        # THEN the converted WAV should be streamed from a file
+        ((wav_path, content),) = uploaded
+        assert content == b"wav content"
+        # AND the temporary file should be removed afterwards
+        assert not wav_path.exists()
+
+    def test_skips_duplicate_samples(self, tmp_path, mocker, capsys, mock_fish_client):
+        """Upload should send identical samples only once."""
+        # GIVEN two files with the same content and one that differs in size
+        (tmp_path / "a.wav").write_bytes(b"same audio")
+        (tmp_path / "b.wav").write_bytes(b"same audio")
+        (tmp_path / "c.wav").write_bytes(b"other")
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
+
+        # WHEN upload is called
+        upload(tmp_path, title="Test Voice")
+
+        # THEN only the first copy should be uploaded
+        voices = mock_fish_client.voices.create.call_args.kwargs["voices"]
+        assert [Path(f.name).name for f in voices] == ["a.wav", "c.wav"]
+        # AND the skipped copy should be reported
+        assert "b.wav duplicates a.wav, skipping" in capsys.readouterr().out
+
+    def test_resamples_wav_samples_when_requested(
+        self, tmp_path, mocker, mock_fish_client
+    ):
+        """Upload should convert WAV samples too when resampling is requested."""
+        # GIVEN a WAV sample
+        (tmp_path / "sample.wav").write_bytes(b"RIFF wav data")
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
+
+        def convert_mock(path, dest, **kwargs):
+            dest.write_bytes(b"resampled")
+            return dest
+
+        mock_convert = mocker.patch(
+            "tts.commands.voice.convert_to_wav", side_effect=convert_mock
+        )
+
+        # WHEN upload is called with a sample rate and mono
+        upload(tmp_path, title="Test Voice", sample_rate=22050, mono=True)
+
+        # THEN the WAV sample should be converted with those settings
+        assert mock_convert.call_args.kwargs == {"sample_rate": 22050, "mono": True}
+
 
 class TestListModels:
     """Tests for list_models command."""
@@ -315,14 +466,11 @@ class TestListModels:
         output = capsys.readouterr().out
         assert "FISH_API_KEY" in output
 
-    def test_shows_no_models_message(self, monkeypatch, mocker, capsys):
+    def test_shows_no_models_message(self, mocker, capsys, mock_fish_client):
         """List models should show message when no models found."""
         # GIVEN API returns empty paginated response
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
         mock_result = mocker.MagicMock(items=[], total=0)
-        mock_client.voices.list.return_value = mock_result
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.list.return_value = mock_result
 
         # WHEN list_models is called
         list_models()
@@ -331,10 +479,9 @@ class TestListModels:
         output = capsys.readouterr().out
         assert "No voice models" in output
 
-    def test_lists_voice_models(self, monkeypatch, mocker, capsys):
+    def test_lists_voice_models(self, mocker, capsys, mock_fish_client):
         """List models should display voice models."""
         # GIVEN API returns voice models in paginated response
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
         mock_voice1 = mocker.MagicMock(
             id="voice-1",
             title="Voice One",
@@ -356,9 +503,7 @@ class TestListModels:
             created_at="2025-01-02T00:00:00Z",
         )
         mock_result = mocker.MagicMock(items=[mock_voice1, mock_voice2], total=2)
-        mock_client = mocker.MagicMock()
-        mock_client.voices.list.return_value = mock_result
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.list.return_value = mock_result
 
         # WHEN list_models is called
         list_models()
@@ -376,28 +521,24 @@ class TestListModels:
         assert "en" in output
         assert "male" in output
 
-    def test_uses_self_only_parameter(self, monkeypatch, mocker, capsys):
+    def test_uses_self_only_parameter(self, mocker, capsys, mock_fish_client):
         """List models should use self_only=True to list only user's voices."""
         # GIVEN API setup
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
         mock_result = mocker.MagicMock(items=[], total=0)
-        mock_client = mocker.MagicMock()
-        mock_client.voices.list.return_value = mock_result
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.list.return_value = mock_result
 
         # WHEN list_models is called
         list_models()
 
         # THEN API should be called with self_only=True
-        mock_client.voices.list.assert_called_once_with(self_only=True, page_size=100)
+        mock_fish_client.voices.list.assert_called_once_with(
+            self_only=True, page_size=100
+        )
 
-    def test_exits_on_api_error(self, monkeypatch, mocker, capsys):
+    def test_exits_on_api_error(self, capsys, mock_fish_client):
         """List models should exit on API error."""
         # GIVEN API raises exception
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.voices.list.side_effect = Exception("API rate limit exceeded")
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.list.side_effect = Exception("API rate limit exceeded")
 
         # WHEN list_models is called
         with pytest.raises(SystemExit) as exc_info:
@@ -412,15 +553,12 @@ class TestListModels:
 class TestUploadErrors:
     """Tests for upload error handling."""
 
-    def test_exits_on_api_error(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_exits_on_api_error(self, tmp_path, capsys, mock_fish_client):
         """Upload should exit on API error."""
         # GIVEN audio file and API fails
         (tmp_path / "sample.wav").write_bytes(b"audio content")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.voices.create.side_effect = Exception("Insufficient credits")
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.create.side_effect = Exception("Insufficient credits")
 
         # WHEN upload is called
         with pytest.raises(SystemExit) as exc_info:
@@ -431,22 +569,20 @@ class TestUploadErrors:
         output = capsys.readouterr().out
         assert "Error creating voice model" in output
 
-    def test_handles_conversion_error(self, tmp_path, monkeypatch, mocker, capsys):
+    def test_handles_conversion_error(self, tmp_path, mocker, capsys, mock_fish_client):
         """Upload should skip files that fail conversion."""
         # GIVEN mp3 file that fails conversion
         (tmp_path / "bad.mp3").write_bytes(b"corrupt audio")
         (tmp_path / "good.wav").write_bytes(b"good audio")
 
-        monkeypatch.setenv("FISH_API_KEY", "test-key")
-        mock_client = mocker.MagicMock()
-        mock_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
-        mocker.patch("fishaudio.FishAudio", return_value=mock_client)
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
 
         # Mock convert_to_wav to fail for mp3
-        def convert_mock(path):
+        def convert_mock(path, dest, **kwargs):
             if path.suffix == ".mp3":
                 raise RuntimeError("ffmpeg error")
-            return b"wav content"
+            dest.write_bytes(b"wav content")
+            return dest
 
         mocker.patch("tts.commands.voice.convert_to_wav", side_effect=convert_mock)
 
@@ -458,4 +594,59 @@ class TestUploadErrors:
         assert "Skipped" in output
         assert "bad.mp3" in output
         # AND voice should still be created with good file
-        mock_client.voices.create.assert_called_once()
+        mock_fish_client.voices.create.assert_called_once()
+
+    def test_skips_unreadable_sample(self, tmp_path, mocker, capsys, mock_fish_client):
+        """Upload should skip a sample it cannot open and upload the rest."""
+        # GIVEN two WAV samples, one of which can't be opened
+        (tmp_path / "good.wav").write_bytes(b"good audio")
+        (tmp_path / "locked.wav").write_bytes(b"locked audio")
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
+
+        real_open = open
+
+        def open_mock(path, *args, **kwargs):
+            if Path(path).name == "locked.wav":
+                raise PermissionError("Permission denied")
+            return real_open(path, *args, **kwargs)
+
+        mocker.patch("tts.commands.voice.open", side_effect=open_mock, create=True)
+
+        # WHEN upload is called
+        upload(tmp_path, title="Test Voice")
+
+        # THEN the unreadable sample should be reported as skipped
+        output = capsys.readouterr().out
+        assert "Could not read locked.wav: Permission denied" in output
+        # AND the readable sample should still be uploaded
+        voices = mock_fish_client.voices.create.call_args.kwargs["voices"]
+        assert [Path(f.name).name for f in voices] == ["good.wav"]
+
+    def test_converts_samples_concurrently_in_order(
+        self, tmp_path, monkeypatch, mocker, mock_fish_client
+    ):
+        """Upload should overlap conversions and keep samples in file order."""
+        # GIVEN several files that need conversion
+        for name in ("a.mp3", "b.mp3", "c.mp3"):
+            (tmp_path / name).write_bytes(name.encode())
+
+        mock_fish_client.voices.create.return_value = mocker.MagicMock(id="voice-123")
+        monkeypatch.setattr("tts.commands.voice.MAX_CONVERT_WORKERS", 3)
+
+        # Each conversion waits until all three are running at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def convert_mock(path, dest, **kwargs):
+            barrier.wait()
+            dest.write_bytes(path.stem.encode())
+            return dest
+
+        mocker.patch("tts.commands.voice.convert_to_wav", side_effect=convert_mock)
+
+        # WHEN upload is called
+        upload(tmp_path, title="Test Voice")
+
+        # THEN samples should be uploaded in sorted file order
+        voices = mock_fish_client.voices.create.call_args.kwargs["voices"]
+        names = [Path(f.name).name for f in voices]
+        assert names == ["a.mp3.wav", "b.mp3.wav", "c.mp3.wav"]